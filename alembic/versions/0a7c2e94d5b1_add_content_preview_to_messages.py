@@ -0,0 +1,30 @@
+"""add content preview to messages
+
+Revision ID: 0a7c2e94d5b1
+Revises: f3d61b8c0e72
+Create Date: 2026-10-16 12:06:51.733408
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7c2e94d5b1'
+down_revision: Union[str, None] = 'f3d61b8c0e72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('messages', sa.Column('content_preview', sa.String(length=120), nullable=True))
+    op.execute("""
+        UPDATE messages SET content_preview =
+            CASE WHEN length(content) > 80 THEN left(content, 80) || '...' ELSE content END
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('messages', 'content_preview')
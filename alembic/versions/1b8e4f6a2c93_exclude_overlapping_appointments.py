@@ -0,0 +1,48 @@
+"""exclude overlapping appointments per clinician
+
+Revision ID: 1b8e4f6a2c93
+Revises: 0a7c2e94d5b1
+Create Date: 2026-10-16 13:41:08.215907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b8e4f6a2c93'
+down_revision: Union[str, None] = '0a7c2e94d5b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gist lets the uuid equality share a GiST index with the range overlap
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.add_column('appointments', sa.Column(
+        'scheduled_range',
+        postgresql.TSRANGE(),
+        sa.Computed(
+            "tsrange(scheduled_date + scheduled_time, "
+            "scheduled_date + scheduled_time + make_interval(mins => duration_minutes))",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    # Fails if existing live appointments already overlap; resolve those before upgrading
+    op.create_exclude_constraint(
+        'excl_appointments_clinician_slot',
+        'appointments',
+        ('clinician_id', '='),
+        ('scheduled_range', '&&'),
+        using='gist',
+        where=sa.text("status <> 'CANCELLED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('excl_appointments_clinician_slot', 'appointments')
+    op.drop_column('appointments', 'scheduled_range')
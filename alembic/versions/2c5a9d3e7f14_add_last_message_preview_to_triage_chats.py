@@ -0,0 +1,31 @@
+"""add last message preview to triage chats
+
+Revision ID: 2c5a9d3e7f14
+Revises: 1b8e4f6a2c93
+Create Date: 2026-10-16 14:02:37.548120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c5a9d3e7f14'
+down_revision: Union[str, None] = '1b8e4f6a2c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('triage_chats', sa.Column(
+        'last_message_preview',
+        sa.String(length=200),
+        sa.Computed("(messages->-1->>'content')::varchar(200)", persisted=True),
+        nullable=True,
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('triage_chats', 'last_message_preview')
@@ -0,0 +1,28 @@
+"""index patient appointment lists
+
+Revision ID: 3d7f1c8b5e26
+Revises: 2c5a9d3e7f14
+Create Date: 2026-10-16 15:18:44.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7f1c8b5e26'
+down_revision: Union[str, None] = '2c5a9d3e7f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_appointments_patient_date_time', 'appointments', ['patient_id', 'scheduled_date', 'scheduled_time'], unique=False)
+    op.create_index('idx_appointment_requests_patient_created', 'appointment_requests', ['patient_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_appointment_requests_patient_created', table_name='appointment_requests')
+    op.drop_index('idx_appointments_patient_date_time', table_name='appointments')
@@ -0,0 +1,28 @@
+"""index clinician review counts
+
+Revision ID: 4e2b8a6d9c31
+Revises: 3d7f1c8b5e26
+Create Date: 2026-10-16 16:05:12.337091
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e2b8a6d9c31'
+down_revision: Union[str, None] = '3d7f1c8b5e26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_triage_cases_reviewer_updated', 'triage_cases', ['reviewed_by', 'updated_at'], unique=False)
+    op.create_index('idx_escalated_queries_answerer_answered', 'escalated_queries', ['answered_by', 'answered_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_escalated_queries_answerer_answered', table_name='escalated_queries')
+    op.drop_index('idx_triage_cases_reviewer_updated', table_name='triage_cases')
@@ -0,0 +1,26 @@
+"""index triage cases by patient
+
+Revision ID: 5a9c3e1f7b48
+Revises: 4e2b8a6d9c31
+Create Date: 2026-10-16 16:22:47.610254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9c3e1f7b48'
+down_revision: Union[str, None] = '4e2b8a6d9c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_triage_cases_patient_created', 'triage_cases', ['patient_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_triage_cases_patient_created', table_name='triage_cases')
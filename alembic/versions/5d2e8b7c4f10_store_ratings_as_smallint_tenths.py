@@ -0,0 +1,31 @@
+"""store ratings as smallint tenths
+
+Revision ID: 5d2e8b7c4f10
+Revises: a3c91f5e27b4
+Create Date: 2026-10-16 09:48:37.602914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8b7c4f10'
+down_revision: Union[str, None] = 'a3c91f5e27b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('hospitals', 'clinicians'):
+        op.alter_column(table, 'rating', server_default=None, existing_nullable=False)
+        op.alter_column(table, 'rating', type_=sa.SmallInteger(), existing_type=sa.Numeric(precision=2, scale=1), existing_nullable=False, postgresql_using='round(rating * 10)::smallint')
+        op.alter_column(table, 'rating', new_column_name='rating_tenths', existing_type=sa.SmallInteger(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    for table in ('hospitals', 'clinicians'):
+        op.alter_column(table, 'rating_tenths', new_column_name='rating', existing_type=sa.SmallInteger(), existing_nullable=False)
+        op.alter_column(table, 'rating', type_=sa.Numeric(precision=2, scale=1), existing_type=sa.SmallInteger(), existing_nullable=False, postgresql_using='(rating / 10.0)::numeric(2, 1)')
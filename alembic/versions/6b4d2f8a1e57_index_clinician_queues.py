@@ -0,0 +1,30 @@
+"""index clinician triage and escalation queues
+
+Revision ID: 6b4d2f8a1e57
+Revises: 5a9c3e1f7b48
+Create Date: 2026-10-16 17:05:12.384610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b4d2f8a1e57'
+down_revision: Union[str, None] = '5a9c3e1f7b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_triage_cases_queue', 'triage_cases', [sa.text('urgency DESC'), sa.text('created_at DESC')], unique=False, postgresql_where=sa.text("status IN ('PENDING', 'IN_REVIEW')"))
+    op.create_index('idx_escalated_queries_queue', 'escalated_queries', [sa.text('urgency DESC'), sa.text('created_at DESC')], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('idx_escalated_queries_pending', table_name='escalated_queries', postgresql_where=sa.text("status = 'PENDING'"))
+
+
+def downgrade() -> None:
+    op.create_index('idx_escalated_queries_pending', 'escalated_queries', ['created_at'], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('idx_escalated_queries_queue', table_name='escalated_queries', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('idx_triage_cases_queue', table_name='triage_cases', postgresql_where=sa.text("status IN ('PENDING', 'IN_REVIEW')"))
@@ -0,0 +1,42 @@
+"""add patient display id and user initials
+
+Revision ID: 7c1e5a9d3f62
+Revises: 6b4d2f8a1e57
+Create Date: 2026-10-16 17:41:08.926314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9d3f62'
+down_revision: Union[str, None] = '6b4d2f8a1e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column(
+        'initials',
+        sa.String(length=2),
+        sa.Computed(
+            "CASE WHEN first_name <> '' AND last_name <> '' "
+            "THEN upper(left(first_name, 1) || left(last_name, 1)) ELSE '' END",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('patients', sa.Column(
+        'display_id',
+        sa.String(length=8),
+        sa.Computed("'KLQ-' || upper(left(id::text, 4))", persisted=True),
+        nullable=True,
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('patients', 'display_id')
+    op.drop_column('users', 'initials')
@@ -0,0 +1,26 @@
+"""add ai recommendation to triage cases
+
+Revision ID: 8d3f6b2a4c19
+Revises: 7c1e5a9d3f62
+Create Date: 2026-10-16 18:26:53.170492
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f6b2a4c19'
+down_revision: Union[str, None] = '7c1e5a9d3f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('triage_cases', sa.Column('ai_recommendation', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('triage_cases', 'ai_recommendation')
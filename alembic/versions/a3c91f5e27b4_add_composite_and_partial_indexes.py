@@ -0,0 +1,32 @@
+"""add composite and partial indexes
+
+Revision ID: a3c91f5e27b4
+Revises: 8f11afe12d4e
+Create Date: 2026-10-16 09:12:04.118362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91f5e27b4'
+down_revision: Union[str, None] = '8f11afe12d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_users_role_active', 'users', ['role'], unique=False, postgresql_where=sa.text('is_active = true'))
+    op.create_index('idx_clinicians_hospital_role_status', 'clinicians', ['hospital_id', 'role_type', 'status'], unique=False)
+    op.create_index('idx_patient_hospitals_hospital', 'patient_hospitals', ['hospital_id'], unique=False)
+    op.create_index('idx_appointments_clinician_date', 'appointments', ['clinician_id', 'scheduled_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_appointments_clinician_date', table_name='appointments')
+    op.drop_index('idx_patient_hospitals_hospital', table_name='patient_hospitals')
+    op.drop_index('idx_clinicians_hospital_role_status', table_name='clinicians')
+    op.drop_index('idx_users_role_active', table_name='users', postgresql_where=sa.text('is_active = true'))
@@ -0,0 +1,26 @@
+"""drop redundant conversation participant_1 index
+
+Revision ID: b71f4d2a9c63
+Revises: 5d2e8b7c4f10
+Create Date: 2026-10-16 10:21:55.406187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71f4d2a9c63'
+down_revision: Union[str, None] = '5d2e8b7c4f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_conversations_participant_1', table_name='conversations')
+
+
+def downgrade() -> None:
+    op.create_index('idx_conversations_participant_1', 'conversations', ['participant_1_id'], unique=False)
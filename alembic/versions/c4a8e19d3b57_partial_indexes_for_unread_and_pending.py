@@ -0,0 +1,32 @@
+"""partial indexes for unread notifications and pending requests
+
+Revision ID: c4a8e19d3b57
+Revises: b71f4d2a9c63
+Create Date: 2026-10-16 10:43:12.870214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e19d3b57'
+down_revision: Union[str, None] = 'b71f4d2a9c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_notifications_unread', table_name='notifications')
+    op.create_index('idx_notifications_unread', 'notifications', ['user_id', 'created_at'], unique=False, postgresql_where=sa.text('is_read = false'))
+    op.create_index('idx_appointment_requests_pending', 'appointment_requests', ['created_at'], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+    op.create_index('idx_escalated_queries_pending', 'escalated_queries', ['created_at'], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_escalated_queries_pending', table_name='escalated_queries', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('idx_appointment_requests_pending', table_name='appointment_requests', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('idx_notifications_unread', table_name='notifications', postgresql_where=sa.text('is_read = false'))
+    op.create_index('idx_notifications_unread', 'notifications', ['user_id', 'is_read'], unique=False)
@@ -0,0 +1,30 @@
+"""covering index for message paging
+
+Revision ID: d92b5f7e1a04
+Revises: c4a8e19d3b57
+Create Date: 2026-10-16 11:02:47.295530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd92b5f7e1a04'
+down_revision: Union[str, None] = 'c4a8e19d3b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_messages_conversation_created', table_name='messages')
+    op.create_index('idx_messages_conversation_created', 'messages', ['conversation_id', 'created_at'], unique=False, postgresql_include=['sender_id', 'is_read', 'message_type'])
+    op.drop_index('idx_messages_conversation', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index('idx_messages_conversation', 'messages', ['conversation_id'], unique=False)
+    op.drop_index('idx_messages_conversation_created', table_name='messages')
+    op.create_index('idx_messages_conversation_created', 'messages', ['conversation_id', 'created_at'], unique=False)
@@ -0,0 +1,28 @@
+"""index clinician points by clinician
+
+Revision ID: e15c7a3f8d29
+Revises: d92b5f7e1a04
+Create Date: 2026-10-16 11:24:09.551873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e15c7a3f8d29'
+down_revision: Union[str, None] = 'd92b5f7e1a04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_clinician_points_clinician_month', 'clinician_points', ['clinician_id', 'month'], unique=False)
+    op.create_index('idx_clinician_points_clinician_created', 'clinician_points', ['clinician_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_clinician_points_clinician_created', table_name='clinician_points')
+    op.drop_index('idx_clinician_points_clinician_month', table_name='clinician_points')
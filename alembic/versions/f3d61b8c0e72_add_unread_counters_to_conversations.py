@@ -0,0 +1,40 @@
+"""add unread counters to conversations
+
+Revision ID: f3d61b8c0e72
+Revises: e15c7a3f8d29
+Create Date: 2026-10-16 11:48:30.164922
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3d61b8c0e72'
+down_revision: Union[str, None] = 'e15c7a3f8d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('unread_count_p1', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('conversations', sa.Column('unread_count_p2', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    # Backfill from existing unread messages
+    op.execute("""
+        UPDATE conversations c SET
+            unread_count_p1 = (
+                SELECT count(*) FROM messages m
+                WHERE m.conversation_id = c.id AND m.is_read = false AND m.sender_id <> c.participant_1_id
+            ),
+            unread_count_p2 = (
+                SELECT count(*) FROM messages m
+                WHERE m.conversation_id = c.id AND m.is_read = false AND m.sender_id <> c.participant_2_id
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('conversations', 'unread_count_p2')
+    op.drop_column('conversations', 'unread_count_p1')
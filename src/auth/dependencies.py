@@ -4,12 +4,13 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 from jwt.exceptions import DecodeError
 import jwt
 
 from src.common.config import settings
 from src.common.database.database import get_db_session
-from src.models.models import User
+from src.models.models import Clinician, User
 
 bearer_scheme = HTTPBearer()
 
@@ -41,7 +42,16 @@ async def get_current_user(
     except Exception as e:
         raise credentials_exception from e
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Join the patient or clinician profile in so services read user.patient /
+    # user.clinician without another round trip (one-to-one, so no row fan-out)
+    result = await db.execute(
+        select(User)
+        .options(
+            joinedload(User.patient),
+            joinedload(User.clinician).joinedload(Clinician.hospital),
+        )
+        .where(User.id == user_id)
+    )
     user = result.scalars().first()
     if user is None:
         raise credentials_exception
@@ -0,0 +1,103 @@
+# src/common/cache/cache.py
+"""Short-lived read-through cache for dashboard aggregates.
+
+Backed by Redis when ``REDIS_URL`` is set (shared by every worker), otherwise by
+a per-process dict, so local development needs nothing extra. Values go through
+orjson either way: factories must return JSON-serialisable data, and callers
+rebuild their response models from what comes back.
+"""
+
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+
+from src.common.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional; the in-process cache is always available
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Version namespaces shared between the modules that read and write the data.
+# Bumped whenever the pending appointment-request count changes.
+APPOINTMENT_REQUESTS_NAMESPACE = "appointment_requests"
+
+_redis = aioredis.from_url(settings.REDIS_URL) if aioredis is not None and settings.REDIS_URL else None
+
+# In-process fallback: key -> (expires_at, payload)
+_LOCAL_MAX_ENTRIES = 4096
+_local: Dict[str, Tuple[float, bytes]] = {}
+_local_versions: Dict[str, int] = {}
+
+
+async def _get(key: str) -> Optional[bytes]:
+    if _redis is not None:
+        return await _redis.get(key)
+    entry = _local.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= monotonic():
+        _local.pop(key, None)
+        return None
+    return entry[1]
+
+
+async def _set(key: str, payload: bytes, ttl: int) -> None:
+    if _redis is not None:
+        await _redis.set(key, payload, ex=ttl)
+    else:
+        now = monotonic()
+        if len(_local) >= _LOCAL_MAX_ENTRIES:
+            # Keys embed dates and versions, so stale ones are never read again; sweep them
+            for stale in [k for k, (expires_at, _) in _local.items() if expires_at <= now]:
+                del _local[stale]
+        _local[key] = (now + ttl, payload)
+
+
+async def cached(key: str, ttl: int, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for ``key``, or await ``factory()`` and cache it for ``ttl`` seconds."""
+    if ttl <= 0:
+        return await factory()
+
+    try:
+        payload = await _get(key)
+    except Exception as e:
+        # A cache outage only costs the DB queries it was saving
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return await factory()
+    if payload is not None:
+        return orjson.loads(payload)
+
+    value = await factory()
+    try:
+        await _set(key, orjson.dumps(value), ttl)
+    except Exception as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+    return value
+
+
+async def get_version(namespace: str) -> int:
+    """Current version of ``namespace``; fold it into keys so a bump orphans every old entry."""
+    if _redis is None:
+        return _local_versions.get(namespace, 0)
+    try:
+        version = await _redis.get(f"ver:{namespace}")
+    except Exception as e:
+        logger.warning("Cache version read failed for %s: %s", namespace, e)
+        return 0
+    return int(version) if version else 0
+
+
+async def bump_version(namespace: str) -> None:
+    """Invalidate everything keyed under ``namespace`` in O(1)."""
+    if _redis is None:
+        _local_versions[namespace] = _local_versions.get(namespace, 0) + 1
+        return
+    try:
+        await _redis.incr(f"ver:{namespace}")
+    except Exception as e:
+        logger.warning("Cache version bump failed for %s: %s", namespace, e)
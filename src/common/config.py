@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Tuple
 from dotenv import load_dotenv
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
@@ -21,11 +21,27 @@ class Settings(BaseSettings):
     # DB_NAME: str
     DATABASE_URL: str
     ALEMBIC_DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    # Hard cap at DB_POOL_SIZE so load can't exhaust the server. Most requests use one
+    # connection; the clinician dashboard and patient detail release their own and then
+    # hold up to 4 at once.
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_WARM_SIZE: int = 5  # Connections opened at startup (keep <= pool size)
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a pooled connection before failing the request
+    DB_ECHO_POOL: bool = False  # Log pool checkouts/checkins (load testing)
+    DB_STATEMENT_CACHE_SIZE: int = 512  # Prepared statements cached per connection (0 for PgBouncer transaction mode or while migrating under load)
     JWT_SECRET: str
     JWT_ALGORITHM: str
     JWT_EXPIRATION_MINUTES: int
-    ALLOWED_ORIGINS: List[str] = ["*"]
+    ALLOWED_ORIGINS: Tuple[str, ...] = ("*",)
     LOG_LEVEL: str = "info"
+    THREADPOOL_TOKENS: int = 200  # AnyIO worker threads for sync dependencies/file I/O
+    LOOP_GUARD_THRESHOLD_MS: int = 50  # Warn when the event loop stalls this long (0 disables)
+    STRICT_ORM_LOADING: bool = False  # Raise on any relationship a query didn't eager-load (dev/CI)
+    DEPARTMENT_CACHE_TTL_SECONDS: int = 300  # Per-worker cache of active departments per hospital (0 disables)
+    REDIS_URL: str = ""  # Shared cache for dashboard aggregates; empty uses a per-worker in-memory cache
+    CLINICIAN_STATS_CACHE_TTL_SECONDS: int = 30  # Clinician dashboard stats and sidebar counts (0 disables)
+    DOCTORS_CACHE_TTL_SECONDS: int = 300  # Per-hospital doctor roster for scheduling (0 disables)
 
     # Email settings
     EMAIL_SENDER: str
@@ -43,7 +59,7 @@ class Settings(BaseSettings):
     @field_validator("ALLOWED_ORIGINS", mode="before")
     def split_origins(cls, value):
         if isinstance(value, str):
-            return [origin.strip() for origin in value.split(",") if origin.strip()]
+            return tuple(origin.strip() for origin in value.split(",") if origin.strip())
         return value
 
 settings = Settings()
\ No newline at end of file
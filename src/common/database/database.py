@@ -1,26 +1,35 @@
+import asyncio
 from typing import AsyncGenerator
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.common.config import settings  # Import the settings object
 
 # SQLAlchemy async engine and session setup
-# Disable prepared statement caching to avoid InvalidCachedStatementError after schema changes
-# This is especially important with Neon's connection pooler
+# Prepared statements are cached per connection (DB_STATEMENT_CACHE_SIZE). A cached
+# statement goes stale when a migration alters a table it reads, and asyncpg then
+# raises InvalidCachedStatementError on that connection. When running ALTER migrations
+# against a live app, either deploy with DB_STATEMENT_CACHE_SIZE=0 for the duration or
+# restart the workers afterwards so every connection starts with an empty cache.
+# Behind Neon's pooled endpoint (transaction-mode PgBouncer) keep it at 0 permanently.
 engine = create_async_engine(
     settings.DATABASE_URL, 
     echo=settings.DEBUG, 
     future=True, 
     pool_pre_ping=True, 
     pool_recycle=1800,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    echo_pool="debug" if settings.DB_ECHO_POOL else False,
     # pool_recycle=300,  # Recycle connections more frequently
-    # connect_args={
-    #     "prepared_statement_cache_size": 0,  # Disable asyncpg prepared statement cache
-    #     "statement_cache_size": 0,  # Disable statement cache
-    # },
+    # Per-connection prepared statement caches (SQLAlchemy's and asyncpg's own)
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
-async_session = sessionmaker(
+async_session = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
@@ -35,6 +44,21 @@ async def connect_to_db():
         print(f"Error connecting to the database: {e}")
         raise
 
+async def warm_connection_pool(size: int) -> None:
+    """Open `size` pooled connections up front so early requests skip the handshake."""
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    if size <= 0:
+        return
+    try:
+        await asyncio.gather(*[_ping() for _ in range(size)])
+        print(f"Database pool warmed with {size} connections")
+    except Exception as e:
+        # A cold pool is only slower, so don't block startup on it
+        print(f"Error warming the database pool: {e}")
+
 async def close_db_connection():
     """Close the database connection."""
     try:
@@ -0,0 +1,24 @@
+# src/common/exceptions.py
+"""Service-layer errors, mapped to HTTP responses by the handler in src/main.py."""
+
+
+class ServiceError(ValueError):
+    """A request the service refuses, with a message safe to show the client (400).
+
+    Subclasses ValueError so existing ``except ValueError`` call sites keep working;
+    only this family is mapped to a client error, other ValueErrors remain 500s.
+    """
+
+    status_code = 400
+
+
+class ForbiddenError(ServiceError):
+    """The current user may not access the resource (403)."""
+
+    status_code = 403
+
+
+class NotFoundError(ServiceError):
+    """The requested resource does not exist (404)."""
+
+    status_code = 404
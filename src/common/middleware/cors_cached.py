@@ -0,0 +1,29 @@
+# src/common/middleware/cors_cached.py
+"""CORS middleware with precomputed lookup structures."""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that freezes its allow-lists once at startup.
+
+    Starlette already joins the preflight header strings in ``__init__``, but it
+    keeps ``allow_methods``/``allow_headers`` as lists and scans them on every
+    preflight. Here they are turned into frozensets so the membership checks
+    are O(1), and origin matching uses a frozenset instead of a list scan.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.allow_methods = frozenset(self.allow_methods)
+        self.allow_headers = frozenset(self.allow_headers)
+        self._allowed_origins = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+        return origin in self._allowed_origins
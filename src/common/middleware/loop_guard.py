@@ -0,0 +1,76 @@
+# src/common/middleware/loop_guard.py
+"""Event-loop blocking detector with per-request attribution."""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LoopGuard:
+    """
+    Logs whenever the event loop is blocked for longer than ``threshold_ms``.
+
+    A background heartbeat sleeps for a fixed interval and measures how late it
+    wakes up. Any lag above the threshold means something ran synchronously on
+    the loop (a blocking client call, CPU-heavy parsing, ...), so the warning
+    lists the requests that were in flight at the time to point at the culprit.
+
+    The heartbeat is started and stopped by the app lifespan; LoopGuardMiddleware
+    only records which requests are in flight.
+    """
+
+    def __init__(self, threshold_ms: int = 50) -> None:
+        self.threshold = threshold_ms / 1000
+        self.in_flight: Dict[int, Tuple[str, str]] = {}
+        self._monitor: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.get_running_loop().create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._monitor is None:
+            return
+        self._monitor.cancel()
+        try:
+            await self._monitor
+        except asyncio.CancelledError:
+            pass
+        self._monitor = None
+
+    async def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.threshold
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lag = loop.time() - started - interval
+            if lag > self.threshold:
+                requests = ", ".join(f"{m} {p}" for m, p in self.in_flight.values()) or "none"
+                logger.warning(
+                    "Event loop blocked for %.0f ms (in-flight: %s)", lag * 1000, requests
+                )
+
+
+class LoopGuardMiddleware:
+    """Registers each HTTP request with a LoopGuard while it is being handled."""
+
+    def __init__(self, app: ASGIApp, guard: LoopGuard) -> None:
+        self.app = app
+        self.guard = guard
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key = id(scope)
+        self.guard.in_flight[key] = (scope["method"], scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.guard.in_flight.pop(key, None)
@@ -1,4 +1,16 @@
-class GlobalMessages:
+class _FrozenMessages(type):
+    """Metaclass that rejects attribute writes so messages stay constant."""
+
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"{cls.__name__} is read-only")
+
+    def __delattr__(cls, name):
+        raise AttributeError(f"{cls.__name__} is read-only")
+
+
+class GlobalMessages(metaclass=_FrozenMessages):
+    __slots__ = ()
+
     # Auth Messages
     INVALID_CREDENTIALS = "Invalid credentials provided."
     TOKEN_EXPIRED = "Token has expired."
@@ -16,6 +28,3 @@ class GlobalMessages:
 
     #User Messages
     USER_NOT_FOUND = "User not found."
-
-    
-    
\ No newline at end of file
@@ -1,19 +1,46 @@
 # src/models/models.py
 
-from typing import List
-import uuid
 import enum
 
+from uuid6 import uuid7
+
 from sqlalchemy import (
-    ARRAY, JSON, Boolean, CheckConstraint, Column, Date, Float, ForeignKey, 
-    Index, Integer, Numeric, String, Text, DateTime, Time,
-    Enum as SAEnum, UniqueConstraint,
-    func,
+    Boolean, Column, Computed, Date, DateTime, Enum as SAEnum, Float, ForeignKey,
+    Index, Integer, Numeric, SmallInteger, String, Text, Time, UniqueConstraint,
+    func, inspect, text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import declarative_base, relationship, backref
+from sqlalchemy.dialects.postgresql import ExcludeConstraint, JSONB, TSRANGE, UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, relationship, validates
+
+
+class Base(DeclarativeBase):
+    def _safe_repr(self, **fields: str) -> str:
+        """Format ``label=attribute`` pairs from already-loaded state only, so repr never emits SQL."""
+        loaded = inspect(self).dict
+        parts = []
+        for label, attr in fields.items():
+            value = loaded.get(attr, "<not loaded>")
+            parts.append(f"{label}={value.value if isinstance(value, enum.Enum) else value}")
+        return f"<{type(self).__name__}({', '.join(parts)})>"
+
+
+class RatingMixin:
+    """Stores a 0.0-5.0 rating as integer tenths (0-50) and exposes it as a float."""
+    rating_tenths = Column(SmallInteger, default=0, nullable=False)
 
-Base = declarative_base()
+    @hybrid_property
+    def rating(self) -> float:
+        return (self.rating_tenths or 0) / 10
+
+    @rating.setter
+    def rating(self, value) -> None:
+        self.rating_tenths = int(round(float(value or 0) * 10))
+
+    @rating.expression
+    def rating(cls):
+        return cls.rating_tenths / 10.0
 
 
 # ============================================================================
@@ -147,6 +174,34 @@ class NotificationType(enum.Enum):
     SYSTEM = "system"
 
 
+# ============================================================================
+# SHARED ENUM TYPES
+# ============================================================================
+
+# One SAEnum per PostgreSQL enum type, reused by every column that stores it
+# (names match the types created by the initial migration)
+_USER_ROLE_T = SAEnum(UserRole, name="userrole")
+_CLINICIAN_ROLE_TYPE_T = SAEnum(ClinicianRoleType, name="clinicianroletype")
+_CLINICIAN_STATUS_T = SAEnum(ClinicianStatus, name="clinicianstatus")
+_HOSPITAL_TYPE_T = SAEnum(HospitalType, name="hospitaltype")
+_SUBSCRIPTION_PLAN_T = SAEnum(SubscriptionPlan, name="subscriptionplan")
+_APPOINTMENT_TYPE_T = SAEnum(AppointmentType, name="appointmenttype")
+_APPOINTMENT_STATUS_T = SAEnum(AppointmentStatus, name="appointmentstatus")
+_REQUEST_STATUS_T = SAEnum(RequestStatus, name="requeststatus")
+_URGENCY_LEVEL_T = SAEnum(UrgencyLevel, name="urgencylevel")
+_RECORDING_STATUS_T = SAEnum(RecordingStatus, name="recordingstatus")
+_MEDICAL_HISTORY_TYPE_T = SAEnum(MedicalHistoryType, name="medicalhistorytype")
+_TRIAGE_STATUS_T = SAEnum(TriageStatus, name="triagestatus")
+_TRIAGE_URGENCY_T = SAEnum(TriageUrgency, name="triageurgency")
+_ESCALATED_QUERY_STATUS_T = SAEnum(EscalatedQueryStatus, name="escalatedquerystatus")
+_INVOICE_STATUS_T = SAEnum(InvoiceStatus, name="invoicestatus")
+_REPORT_TYPE_T = SAEnum(ReportType, name="reporttype")
+_REPORT_STATUS_T = SAEnum(ReportStatus, name="reportstatus")
+_MESSAGE_TYPE_T = SAEnum(MessageType, name="messagetype")
+_PREFERRED_LANGUAGE_T = SAEnum(PreferredLanguage, name="preferredlanguage")
+_NOTIFICATION_TYPE_T = SAEnum(NotificationType, name="notificationtype")
+
+
 # ============================================================================
 # USER MODELS
 # ============================================================================
@@ -154,12 +209,21 @@ class NotificationType(enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
-    role = Column(SAEnum(UserRole), nullable=False, default=UserRole.PATIENT)
+    role = Column(_USER_ROLE_T, nullable=False, default=UserRole.PATIENT)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
+    # Avatar initials, maintained by Postgres whenever either name changes
+    initials = Column(
+        String(2),
+        Computed(
+            "CASE WHEN first_name <> '' AND last_name <> '' "
+            "THEN upper(left(first_name, 1) || left(last_name, 1)) ELSE '' END",
+            persisted=True,
+        ),
+    )
     phone = Column(String(20), nullable=True)
     avatar_url = Column(String(500), nullable=True)
     email_verified = Column(Boolean, default=False, nullable=False)
@@ -169,15 +233,30 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
+    # Relationships
+    patient = relationship("Patient", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql")
+    clinician = relationship("Clinician", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql")
+    generated_reports = relationship("Report", back_populates="generator", lazy="dynamic")
+    notifications = relationship("Notification", back_populates="user", lazy="select", cascade="all, delete-orphan")
+    conversations_as_p1 = relationship("Conversation", foreign_keys="[Conversation.participant_1_id]", back_populates="participant_1", lazy="dynamic")
+    conversations_as_p2 = relationship("Conversation", foreign_keys="[Conversation.participant_2_id]", back_populates="participant_2", lazy="dynamic")
+    sent_messages = relationship("Message", back_populates="sender", lazy="dynamic")
+
+    __table_args__ = (
+        Index("idx_users_role_active", "role", postgresql_where=text("is_active = true")),
+    )
+
     def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, role={self.role.value})>"
+        return self._safe_repr(id="id", email="email", role="role")
 
 
 class Patient(Base):
     __tablename__ = "patients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
+    # Short KLQ-xxxx id shown to clinicians
+    display_id = Column(String(8), Computed("'KLQ-' || upper(left(id::text, 4))", persisted=True))
     date_of_birth = Column(Date, nullable=True)
     gender = Column(String(20), nullable=True)
     blood_type = Column(String(5), nullable=True)
@@ -189,62 +268,84 @@ class Patient(Base):
     emergency_contact_phone = Column(String(20), nullable=True)
     insurance_provider = Column(String(200), nullable=True)
     insurance_number = Column(String(100), nullable=True)
-    preferred_language = Column(SAEnum(PreferredLanguage), nullable=True)
+    preferred_language = Column(_PREFERRED_LANGUAGE_T, nullable=True)
     onboarding_completed = Column(Boolean, default=False, nullable=False)
+    # Defaults come from the server only: no shared mutable dict, no JSON encoding on insert
     notification_settings = Column(
         JSONB, 
         nullable=True, 
-        default={"appointments": True, "messages": True, "reminders": True, "updates": False},
         server_default='{"appointments": true, "messages": true, "reminders": true, "updates": false}'
     )
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    # Relationship
-    user = relationship("User", backref=backref("patient", uselist=False, cascade="all, delete-orphan"))
+    # Relationships
+    user = relationship("User", back_populates="patient")
+    linked_hospitals = relationship("PatientHospital", back_populates="patient", lazy="raise_on_sql", cascade="all, delete-orphan")
+    appointment_requests = relationship("AppointmentRequest", back_populates="patient", lazy="select", cascade="all, delete-orphan")
+    appointments = relationship("Appointment", back_populates="patient", lazy="dynamic", cascade="all, delete-orphan")
+    recordings = relationship("Recording", back_populates="patient", lazy="dynamic", cascade="all, delete-orphan")
+    medical_history = relationship("MedicalHistory", back_populates="patient", lazy="dynamic", cascade="all, delete-orphan")
+    health_vitals = relationship("HealthVitals", back_populates="patient", lazy="dynamic", cascade="all, delete-orphan")
+    triage_cases = relationship("TriageCase", back_populates="patient", lazy="dynamic", cascade="all, delete-orphan")
+    triage_chats = relationship("TriageChat", back_populates="patient", lazy="select", cascade="all, delete-orphan")
+    escalated_queries = relationship("EscalatedQuery", back_populates="patient", lazy="dynamic")
 
     def __repr__(self):
-        return f"<Patient(id={self.id}, user_id={self.user_id})>"
+        return self._safe_repr(id="id", user_id="user_id")
 
 
-class Clinician(Base):
+class Clinician(RatingMixin, Base):
     __tablename__ = "clinicians"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="SET NULL"), nullable=True)
-    role_type = Column(SAEnum(ClinicianRoleType), nullable=False, default=ClinicianRoleType.DOCTOR)
+    role_type = Column(_CLINICIAN_ROLE_TYPE_T, nullable=False, default=ClinicianRoleType.DOCTOR)
     specialty = Column(String(100), nullable=True)
     license_number = Column(String(100), unique=True, nullable=True)
     years_of_experience = Column(Integer, nullable=True)
     bio = Column(Text, nullable=True)
-    rating = Column(Numeric(2, 1), default=0.0, nullable=False)
     total_consultations = Column(Integer, default=0, nullable=False)
     total_points = Column(Integer, default=0, nullable=False)
-    status = Column(SAEnum(ClinicianStatus), default=ClinicianStatus.ACTIVE, nullable=False)
+    status = Column(_CLINICIAN_STATUS_T, default=ClinicianStatus.ACTIVE, nullable=False)
     is_available = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", backref=backref("clinician", uselist=False, cascade="all, delete-orphan"))
-    hospital = relationship("Hospital", backref=backref("clinicians", lazy="dynamic"))
+    user = relationship("User", back_populates="clinician")
+    hospital = relationship("Hospital", back_populates="clinicians")
+    headed_departments = relationship("Department", back_populates="head_clinician", lazy="raise_on_sql")
+    reviewed_requests = relationship("AppointmentRequest", foreign_keys="[AppointmentRequest.reviewed_by]", back_populates="reviewer", lazy="dynamic")
+    appointments = relationship("Appointment", back_populates="clinician", lazy="dynamic")
+    recordings = relationship("Recording", back_populates="clinician", lazy="dynamic")
+    medical_records = relationship("MedicalHistory", back_populates="clinician", lazy="dynamic")
+    recorded_vitals = relationship("HealthVitals", back_populates="clinician", lazy="dynamic")
+    reviewed_triage_cases = relationship("TriageCase", foreign_keys="[TriageCase.reviewed_by]", back_populates="reviewer", lazy="dynamic")
+    escalated_triage_cases = relationship("TriageCase", foreign_keys="[TriageCase.escalated_to]", back_populates="escalation_doctor", lazy="dynamic")
+    answered_queries = relationship("EscalatedQuery", foreign_keys="[EscalatedQuery.answered_by]", back_populates="answering_doctor", lazy="dynamic")
+    points_history = relationship("ClinicianPoints", back_populates="clinician", lazy="dynamic", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("idx_clinicians_hospital_role_status", "hospital_id", "role_type", "status"),
+    )
 
     def __repr__(self):
-        return f"<Clinician(id={self.id}, role_type={self.role_type.value}, specialty={self.specialty})>"
+        return self._safe_repr(id="id", role_type="role_type", specialty="specialty")
 
 
 # ============================================================================
 # HOSPITAL MODELS
 # ============================================================================
 
-class Hospital(Base):
+class Hospital(RatingMixin, Base):
     __tablename__ = "hospitals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     hospital_code = Column(String(20), unique=True, nullable=False, index=True)  # e.g., HOSP-LUTH-001
     name = Column(String(255), nullable=False)
-    type = Column(SAEnum(HospitalType), nullable=False, default=HospitalType.GENERAL)
+    type = Column(_HOSPITAL_TYPE_T, nullable=False, default=HospitalType.GENERAL)
     address = Column(Text, nullable=False)
     city = Column(String(100), nullable=False)
     state = Column(String(100), nullable=False)
@@ -252,21 +353,29 @@ class Hospital(Base):
     email = Column(String(255), nullable=True)
     website = Column(String(500), nullable=True)
     logo_url = Column(String(500), nullable=True)
-    rating = Column(Numeric(2, 1), default=0.0, nullable=False)
-    subscription_plan = Column(SAEnum(SubscriptionPlan), default=SubscriptionPlan.BASIC, nullable=False)
+    subscription_plan = Column(_SUBSCRIPTION_PLAN_T, default=SubscriptionPlan.BASIC, nullable=False)
     subscription_expires = Column(Date, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
+    # Relationships
+    clinicians = relationship("Clinician", back_populates="hospital", lazy="raise_on_sql")
+    departments = relationship("Department", back_populates="hospital", lazy="raise_on_sql", cascade="all, delete-orphan")
+    linked_patients = relationship("PatientHospital", back_populates="hospital", lazy="raise_on_sql")
+    appointment_requests = relationship("AppointmentRequest", back_populates="hospital", lazy="dynamic")
+    appointments = relationship("Appointment", back_populates="hospital", lazy="dynamic")
+    invoices = relationship("Invoice", back_populates="hospital", lazy="dynamic", cascade="all, delete-orphan")
+    reports = relationship("Report", back_populates="hospital", lazy="dynamic", cascade="all, delete-orphan")
+
     def __repr__(self):
-        return f"<Hospital(id={self.id}, name={self.name})>"
+        return self._safe_repr(id="id", name="name")
 
 
 class Department(Base):
     __tablename__ = "departments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
@@ -275,33 +384,36 @@ class Department(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    hospital = relationship("Hospital", backref=backref("departments", lazy="dynamic", cascade="all, delete-orphan"))
-    head_clinician = relationship("Clinician", backref=backref("headed_departments", lazy="dynamic"))
+    hospital = relationship("Hospital", back_populates="departments")
+    head_clinician = relationship("Clinician", back_populates="headed_departments")
+    appointments = relationship("Appointment", back_populates="department", lazy="dynamic")
 
     __table_args__ = (
         UniqueConstraint("hospital_id", "name", name="uq_department_hospital_name"),
     )
 
     def __repr__(self):
-        return f"<Department(id={self.id}, name={self.name})>"
+        return self._safe_repr(id="id", name="name")
 
 
 class PatientHospital(Base):
     """Junction table for Patient-Hospital many-to-many relationship"""
     __tablename__ = "patient_hospitals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     linked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     total_visits = Column(Integer, default=0, nullable=False)
 
     # Relationships
-    patient = relationship("Patient", backref=backref("linked_hospitals", lazy="dynamic", cascade="all, delete-orphan"))
-    hospital = relationship("Hospital", backref=backref("linked_patients", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="linked_hospitals")
+    hospital = relationship("Hospital", back_populates="linked_patients")
 
     __table_args__ = (
+        # The unique index leads with patient_id; this one serves hospital -> patients lookups
         UniqueConstraint("patient_id", "hospital_id", name="uq_patient_hospital"),
+        Index("idx_patient_hospitals_hospital", "hospital_id"),
     )
 
 
@@ -311,15 +423,17 @@ class PatientHospital(Base):
 
 class AppointmentRequest(Base):
     __tablename__ = "appointment_requests"
+    # Fetch server defaults (created_at etc.) in the INSERT ... RETURNING, not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     department = Column(String(100), nullable=False)
     reason = Column(Text, nullable=False)
-    preferred_type = Column(SAEnum(AppointmentType), nullable=False, default=AppointmentType.IN_PERSON)
-    urgency = Column(SAEnum(UrgencyLevel), default=UrgencyLevel.NORMAL, nullable=False)
-    status = Column(SAEnum(RequestStatus), default=RequestStatus.PENDING, nullable=False)
+    preferred_type = Column(_APPOINTMENT_TYPE_T, nullable=False, default=AppointmentType.IN_PERSON)
+    urgency = Column(_URGENCY_LEVEL_T, default=UrgencyLevel.NORMAL, nullable=False)
+    status = Column(_REQUEST_STATUS_T, default=RequestStatus.PENDING, nullable=False)
     rejection_reason = Column(Text, nullable=True)
     reviewed_by = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
@@ -327,18 +441,28 @@ class AppointmentRequest(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("appointment_requests", lazy="dynamic", cascade="all, delete-orphan"))
-    hospital = relationship("Hospital", backref=backref("appointment_requests", lazy="dynamic"))
-    reviewer = relationship("Clinician", foreign_keys=[reviewed_by], backref=backref("reviewed_requests", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="appointment_requests")
+    hospital = relationship("Hospital", back_populates="appointment_requests")
+    reviewer = relationship("Clinician", foreign_keys=[reviewed_by], back_populates="reviewed_requests")
+    appointment = relationship("Appointment", back_populates="request", uselist=False)
+
+    __table_args__ = (
+        # Nurse review queue: pending requests, newest first
+        Index("idx_appointment_requests_pending", "created_at", postgresql_where=text("status = 'PENDING'")),
+        # Patient's request list, newest first (backward scan, no sort)
+        Index("idx_appointment_requests_patient_created", "patient_id", "created_at"),
+    )
 
     def __repr__(self):
-        return f"<AppointmentRequest(id={self.id}, status={self.status.value})>"
+        return self._safe_repr(id="id", status="status")
 
 
 class Appointment(Base):
     __tablename__ = "appointments"
+    # Fetch server defaults (created_at etc.) in the INSERT ... RETURNING, not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     clinician_id = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="SET NULL"), nullable=True)
@@ -347,8 +471,18 @@ class Appointment(Base):
     scheduled_date = Column(Date, nullable=False)
     scheduled_time = Column(Time, nullable=False)
     duration_minutes = Column(Integer, default=30, nullable=False)
-    type = Column(SAEnum(AppointmentType), nullable=False, default=AppointmentType.IN_PERSON)
-    status = Column(SAEnum(AppointmentStatus), default=AppointmentStatus.UPCOMING, nullable=False)
+    # Derived slot for the overlap constraint; tsrange (not tstzrange) because the
+    # naive date/time columns only give an immutable expression as a timestamp
+    scheduled_range = Column(
+        TSRANGE,
+        Computed(
+            "tsrange(scheduled_date + scheduled_time, "
+            "scheduled_date + scheduled_time + make_interval(mins => duration_minutes))",
+            persisted=True,
+        ),
+    )
+    type = Column(_APPOINTMENT_TYPE_T, nullable=False, default=AppointmentType.IN_PERSON)
+    status = Column(_APPOINTMENT_STATUS_T, default=AppointmentStatus.UPCOMING, nullable=False)
     location = Column(String(200), nullable=True)
     notes = Column(Text, nullable=True)
     cancellation_reason = Column(Text, nullable=True)
@@ -356,19 +490,39 @@ class Appointment(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("appointments", lazy="dynamic", cascade="all, delete-orphan"))
-    clinician = relationship("Clinician", backref=backref("appointments", lazy="dynamic"))
-    hospital = relationship("Hospital", backref=backref("appointments", lazy="dynamic"))
-    department = relationship("Department", backref=backref("appointments", lazy="dynamic"))
-    request = relationship("AppointmentRequest", backref=backref("appointment", uselist=False))
+    patient = relationship("Patient", back_populates="appointments")
+    clinician = relationship("Clinician", back_populates="appointments")
+    hospital = relationship("Hospital", back_populates="appointments")
+    department = relationship("Department", back_populates="appointments")
+    request = relationship("AppointmentRequest", back_populates="appointment")
+    recordings = relationship("Recording", back_populates="appointment", lazy="dynamic")
+
+    SLOT_CONSTRAINT = "excl_appointments_clinician_slot"
 
     __table_args__ = (
         Index("idx_appointments_date", "scheduled_date"),
         Index("idx_appointments_status", "status"),
+        Index("idx_appointments_clinician_date", "clinician_id", "scheduled_date"),
+        # Patient's appointment list in schedule order; status stays out of the key so the
+        # unfiltered list (the default) is served too, and a patient's rows are few to filter
+        Index("idx_appointments_patient_date_time", "patient_id", "scheduled_date", "scheduled_time"),
+        # A clinician can't hold two live appointments whose slots overlap (needs btree_gist)
+        ExcludeConstraint(
+            ("clinician_id", "="),
+            ("scheduled_range", "&&"),
+            name=SLOT_CONSTRAINT,
+            using="gist",
+            where=text("status <> 'CANCELLED'"),
+        ),
     )
 
+    @classmethod
+    def is_slot_conflict(cls, exc: IntegrityError) -> bool:
+        """Whether a flush failed on the clinician double-booking exclusion constraint."""
+        return cls.SLOT_CONSTRAINT in str(exc.orig)
+
     def __repr__(self):
-        return f"<Appointment(id={self.id}, date={self.scheduled_date}, status={self.status.value})>"
+        return self._safe_repr(id="id", date="scheduled_date", status="status")
 
 
 # ============================================================================
@@ -378,7 +532,7 @@ class Appointment(Base):
 class Recording(Base):
     __tablename__ = "recordings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     appointment_id = Column(UUID(as_uuid=True), ForeignKey("appointments.id", ondelete="SET NULL"), nullable=True)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     clinician_id = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
@@ -387,25 +541,25 @@ class Recording(Base):
     file_size_bytes = Column(Integer, nullable=True)
     file_url = Column(String(500), nullable=True)
     transcript = Column(Text, nullable=True)
-    status = Column(SAEnum(RecordingStatus), default=RecordingStatus.PROCESSING, nullable=False)
+    status = Column(_RECORDING_STATUS_T, default=RecordingStatus.PROCESSING, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    appointment = relationship("Appointment", backref=backref("recordings", lazy="dynamic"))
-    patient = relationship("Patient", backref=backref("recordings", lazy="dynamic", cascade="all, delete-orphan"))
-    clinician = relationship("Clinician", backref=backref("recordings", lazy="dynamic"))
+    appointment = relationship("Appointment", back_populates="recordings")
+    patient = relationship("Patient", back_populates="recordings")
+    clinician = relationship("Clinician", back_populates="recordings")
 
     def __repr__(self):
-        return f"<Recording(id={self.id}, title={self.title})>"
+        return self._safe_repr(id="id", title="title")
 
 
 class MedicalHistory(Base):
     __tablename__ = "medical_history"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     clinician_id = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
-    type = Column(SAEnum(MedicalHistoryType), nullable=False)
+    type = Column(_MEDICAL_HISTORY_TYPE_T, nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     date = Column(Date, nullable=False)
@@ -414,18 +568,18 @@ class MedicalHistory(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("medical_history", lazy="dynamic", cascade="all, delete-orphan"))
-    clinician = relationship("Clinician", backref=backref("medical_records", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="medical_history")
+    clinician = relationship("Clinician", back_populates="medical_records")
 
     def __repr__(self):
-        return f"<MedicalHistory(id={self.id}, type={self.type.value}, title={self.title})>"
+        return self._safe_repr(id="id", type="type", title="title")
 
 
 class HealthVitals(Base):
     """Track patient health measurements over time."""
     __tablename__ = "health_vitals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     recorded_by = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
     heart_rate = Column(Integer, nullable=True)  # bpm
@@ -438,15 +592,15 @@ class HealthVitals(Base):
     recorded_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("health_vitals", lazy="dynamic", cascade="all, delete-orphan"))
-    clinician = relationship("Clinician", backref=backref("recorded_vitals", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="health_vitals")
+    clinician = relationship("Clinician", back_populates="recorded_vitals")
 
     __table_args__ = (
         Index("idx_health_vitals_patient", "patient_id"),
     )
 
     def __repr__(self):
-        return f"<HealthVitals(id={self.id}, patient_id={self.patient_id})>"
+        return self._safe_repr(id="id", patient_id="patient_id")
 
 
 # ============================================================================
@@ -456,14 +610,15 @@ class HealthVitals(Base):
 class TriageCase(Base):
     __tablename__ = "triage_cases"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     symptoms = Column(Text, nullable=False)
     duration = Column(String(100), nullable=True)
-    urgency = Column(SAEnum(TriageUrgency), nullable=False, default=TriageUrgency.MEDIUM)
-    language = Column(SAEnum(PreferredLanguage), nullable=True, default=PreferredLanguage.ENGLISH)
-    status = Column(SAEnum(TriageStatus), default=TriageStatus.PENDING, nullable=False)
+    urgency = Column(_TRIAGE_URGENCY_T, nullable=False, default=TriageUrgency.MEDIUM)
+    language = Column(_PREFERRED_LANGUAGE_T, nullable=True, default=PreferredLanguage.ENGLISH)
+    status = Column(_TRIAGE_STATUS_T, default=TriageStatus.PENDING, nullable=False)
     ai_summary = Column(Text, nullable=True)
+    ai_recommendation = Column(Text, nullable=True)
     nurse_notes = Column(Text, nullable=True)
     reviewed_by = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
     escalated_to = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
@@ -471,54 +626,70 @@ class TriageCase(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("triage_cases", lazy="dynamic", cascade="all, delete-orphan"))
-    reviewer = relationship("Clinician", foreign_keys=[reviewed_by], backref=backref("reviewed_triage_cases", lazy="dynamic"))
-    escalation_doctor = relationship("Clinician", foreign_keys=[escalated_to], backref=backref("escalated_triage_cases", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="triage_cases")
+    reviewer = relationship("Clinician", foreign_keys=[reviewed_by], back_populates="reviewed_triage_cases")
+    escalation_doctor = relationship("Clinician", foreign_keys=[escalated_to], back_populates="escalated_triage_cases")
+    chats = relationship("TriageChat", back_populates="triage_case", lazy="select")
+    escalated_queries = relationship("EscalatedQuery", back_populates="triage_case", lazy="dynamic", cascade="all, delete-orphan")
 
     __table_args__ = (
         Index("idx_triage_status", "status"),
+        # Latest case per patient (DISTINCT ON in the clinician patients list)
+        Index("idx_triage_cases_patient_created", "patient_id", "created_at"),
+        # Per-clinician "reviewed today/yesterday" dashboard counts
+        Index("idx_triage_cases_reviewer_updated", "reviewed_by", "updated_at"),
+        # Nurse queue: open cases, most urgent then newest first
+        Index(
+            "idx_triage_cases_queue", urgency.desc(), created_at.desc(),
+            postgresql_where=text("status IN ('PENDING', 'IN_REVIEW')"),
+        ),
     )
 
     def __repr__(self):
-        return f"<TriageCase(id={self.id}, status={self.status.value})>"
+        return self._safe_repr(id="id", status="status")
 
 
 class TriageChat(Base):
     """Stores AI chat conversations for patients."""
     __tablename__ = "triage_chats"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     triage_case_id = Column(UUID(as_uuid=True), ForeignKey("triage_cases.id", ondelete="SET NULL"), nullable=True)
     title = Column(String(255), nullable=True)  # Auto-generated from first message
     messages = Column(JSONB, nullable=False, default=list)  # [{role, content, timestamp}]
-    language = Column(SAEnum(PreferredLanguage), nullable=True, default=PreferredLanguage.ENGLISH)
+    # Kept in step by Postgres so chat lists never have to detoast the whole messages blob
+    last_message_preview = Column(
+        String(200),
+        Computed("(messages->-1->>'content')::varchar(200)", persisted=True),
+    )
+    language = Column(_PREFERRED_LANGUAGE_T, nullable=True, default=PreferredLanguage.ENGLISH)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    patient = relationship("Patient", backref=backref("triage_chats", lazy="dynamic", cascade="all, delete-orphan"))
-    triage_case = relationship("TriageCase", backref=backref("chats", lazy="dynamic"))
+    patient = relationship("Patient", back_populates="triage_chats")
+    triage_case = relationship("TriageCase", back_populates="chats")
 
     __table_args__ = (
         Index("idx_triage_chat_patient", "patient_id"),
     )
 
     def __repr__(self):
-        return f"<TriageChat(id={self.id}, patient_id={self.patient_id})>"
+        return self._safe_repr(id="id", patient_id="patient_id")
 
 
 class EscalatedQuery(Base):
     __tablename__ = "escalated_queries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     triage_case_id = Column(UUID(as_uuid=True), ForeignKey("triage_cases.id", ondelete="CASCADE"), nullable=True)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     question = Column(Text, nullable=False)
     nurse_note = Column(Text, nullable=True)
-    urgency = Column(SAEnum(TriageUrgency), nullable=False, default=TriageUrgency.MEDIUM)
-    status = Column(SAEnum(EscalatedQueryStatus), default=EscalatedQueryStatus.PENDING, nullable=False)
+    urgency = Column(_TRIAGE_URGENCY_T, nullable=False, default=TriageUrgency.MEDIUM)
+    status = Column(_ESCALATED_QUERY_STATUS_T, default=EscalatedQueryStatus.PENDING, nullable=False)
     ai_draft = Column(Text, nullable=True)
     doctor_response = Column(Text, nullable=True)
     answered_by = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="SET NULL"), nullable=True)
@@ -526,12 +697,22 @@ class EscalatedQuery(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    triage_case = relationship("TriageCase", backref=backref("escalated_queries", lazy="dynamic", cascade="all, delete-orphan"))
-    patient = relationship("Patient", backref=backref("escalated_queries", lazy="dynamic"))
-    answering_doctor = relationship("Clinician", foreign_keys=[answered_by], backref=backref("answered_queries", lazy="dynamic"))
+    triage_case = relationship("TriageCase", back_populates="escalated_queries")
+    patient = relationship("Patient", back_populates="escalated_queries")
+    answering_doctor = relationship("Clinician", foreign_keys=[answered_by], back_populates="answered_queries")
+
+    __table_args__ = (
+        # Doctor queue: pending queries, most urgent then newest first (also serves the pending count)
+        Index(
+            "idx_escalated_queries_queue", urgency.desc(), created_at.desc(),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Per-clinician "answered today/yesterday" dashboard counts
+        Index("idx_escalated_queries_answerer_answered", "answered_by", "answered_at"),
+    )
 
     def __repr__(self):
-        return f"<EscalatedQuery(id={self.id}, status={self.status.value})>"
+        return self._safe_repr(id="id", status="status")
 
 
 # ============================================================================
@@ -541,7 +722,7 @@ class EscalatedQuery(Base):
 class ClinicianPoints(Base):
     __tablename__ = "clinician_points"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     clinician_id = Column(UUID(as_uuid=True), ForeignKey("clinicians.id", ondelete="CASCADE"), nullable=False)
     action = Column(String(100), nullable=False)
     points = Column(Integer, nullable=False)
@@ -550,10 +731,15 @@ class ClinicianPoints(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationship
-    clinician = relationship("Clinician", backref=backref("points_history", lazy="dynamic", cascade="all, delete-orphan"))
+    clinician = relationship("Clinician", back_populates="points_history")
+
+    __table_args__ = (
+        Index("idx_clinician_points_clinician_month", "clinician_id", "month"),
+        Index("idx_clinician_points_clinician_created", "clinician_id", "created_at"),
+    )
 
     def __repr__(self):
-        return f"<ClinicianPoints(id={self.id}, points={self.points})>"
+        return self._safe_repr(id="id", points="points")
 
 
 # ============================================================================
@@ -563,12 +749,12 @@ class ClinicianPoints(Base):
 class Invoice(Base):
     __tablename__ = "invoices"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     invoice_number = Column(String(50), unique=True, nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     amount = Column(Numeric(12, 2), nullable=False)
     currency = Column(String(3), default="NGN", nullable=False)
-    status = Column(SAEnum(InvoiceStatus), default=InvoiceStatus.PENDING, nullable=False)
+    status = Column(_INVOICE_STATUS_T, default=InvoiceStatus.PENDING, nullable=False)
     due_date = Column(Date, nullable=False)
     paid_at = Column(DateTime(timezone=True), nullable=True)
     description = Column(Text, nullable=True)
@@ -576,10 +762,10 @@ class Invoice(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationship
-    hospital = relationship("Hospital", backref=backref("invoices", lazy="dynamic", cascade="all, delete-orphan"))
+    hospital = relationship("Hospital", back_populates="invoices")
 
     def __repr__(self):
-        return f"<Invoice(id={self.id}, number={self.invoice_number}, status={self.status.value})>"
+        return self._safe_repr(id="id", number="invoice_number", status="status")
 
 
 # ============================================================================
@@ -589,12 +775,12 @@ class Invoice(Base):
 class Report(Base):
     __tablename__ = "reports"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    type = Column(SAEnum(ReportType), nullable=False)
-    status = Column(SAEnum(ReportStatus), default=ReportStatus.PROCESSING, nullable=False)
+    type = Column(_REPORT_TYPE_T, nullable=False)
+    status = Column(_REPORT_STATUS_T, default=ReportStatus.PROCESSING, nullable=False)
     file_url = Column(String(500), nullable=True)
     file_size_bytes = Column(Integer, nullable=True)
     page_count = Column(Integer, nullable=True)
@@ -605,36 +791,37 @@ class Report(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    hospital = relationship("Hospital", backref=backref("reports", lazy="dynamic", cascade="all, delete-orphan"))
-    generator = relationship("User", backref=backref("generated_reports", lazy="dynamic"))
+    hospital = relationship("Hospital", back_populates="reports")
+    generator = relationship("User", back_populates="generated_reports")
 
     def __repr__(self):
-        return f"<Report(id={self.id}, title={self.title}, type={self.type.value})>"
+        return self._safe_repr(id="id", title="title", type="type")
 
 
 class Notification(Base):
     __tablename__ = "notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
-    type = Column(SAEnum(NotificationType), nullable=True)
+    type = Column(_NOTIFICATION_TYPE_T, nullable=True)
     reference_id = Column(UUID(as_uuid=True), nullable=True)
     reference_type = Column(String(50), nullable=True)
     is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationship
-    user = relationship("User", backref=backref("notifications", lazy="dynamic", cascade="all, delete-orphan"))
+    user = relationship("User", back_populates="notifications")
 
     __table_args__ = (
         Index("idx_notifications_user", "user_id"),
-        Index("idx_notifications_unread", "user_id", "is_read"),
+        # Partial: only the (small) unread subset, ordered for the inbox query
+        Index("idx_notifications_unread", "user_id", "created_at", postgresql_where=text("is_read = false")),
     )
 
     def __repr__(self):
-        return f"<Notification(id={self.id}, title={self.title})>"
+        return self._safe_repr(id="id", title="title")
 
 
 # ============================================================================
@@ -648,55 +835,73 @@ class Conversation(Base):
     """
     __tablename__ = "conversations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     participant_1_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     participant_2_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     last_message_at = Column(DateTime(timezone=True), nullable=True)
+    # Unread messages waiting for each participant, maintained on send/read/delete
+    unread_count_p1 = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    unread_count_p2 = Column(Integer, default=0, server_default=text("0"), nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    # Indexed and drives inbox order, so it is bumped explicitly when a message is sent
+    # rather than on every UPDATE; counter-only updates stay HOT-eligible
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships - use explicit foreign_keys to avoid ambiguity
-    participant_1 = relationship("User", foreign_keys=[participant_1_id], backref=backref("conversations_as_p1", lazy="dynamic"))
-    participant_2 = relationship("User", foreign_keys=[participant_2_id], backref=backref("conversations_as_p2", lazy="dynamic"))
+    participant_1 = relationship("User", foreign_keys=[participant_1_id], back_populates="conversations_as_p1")
+    participant_2 = relationship("User", foreign_keys=[participant_2_id], back_populates="conversations_as_p2")
+    messages = relationship("Message", back_populates="conversation", lazy="select", cascade="all, delete-orphan", order_by="Message.created_at")
 
     __table_args__ = (
-        Index("idx_conversations_participant_1", "participant_1_id"),
+        # Participants are stored smaller-ID-first; the unique index also serves
+        # participant_1_id lookups, so only participant_2_id needs its own index
         Index("idx_conversations_participant_2", "participant_2_id"),
         UniqueConstraint("participant_1_id", "participant_2_id", name="uq_conversation_participants"),
         Index("idx_conversations_updated", "updated_at"),
     )
 
     def __repr__(self):
-        return f"<Conversation(id={self.id}, p1={self.participant_1_id}, p2={self.participant_2_id})>"
+        return self._safe_repr(id="id", p1="participant_1_id", p2="participant_2_id")
 
 
 class Message(Base):
     """A message within a conversation."""
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
     sender_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
-    message_type = Column(SAEnum(MessageType), default=MessageType.TEXT, nullable=False)
+    # Inbox preview, kept in sync with content so list queries never read the full text
+    content_preview = Column(String(120), nullable=True)
+    message_type = Column(_MESSAGE_TYPE_T, default=MessageType.TEXT, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
     attachment_url = Column(String(500), nullable=True)
     attachment_name = Column(String(255), nullable=True)
     audio_duration = Column(Integer, nullable=True)  # Duration in seconds for voice messages
-    original_language = Column(SAEnum(PreferredLanguage), nullable=True)  # Language the audio was spoken in
+    original_language = Column(_PREFERRED_LANGUAGE_T, nullable=True)  # Language the audio was spoken in
     transcripts = Column(JSONB, nullable=True)  # Multi-language transcripts: {"yoruba": "...", "english": "..."}
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    conversation = relationship("Conversation", backref=backref("messages", lazy="dynamic", cascade="all, delete-orphan", order_by="Message.created_at"))
-    sender = relationship("User", backref=backref("sent_messages", lazy="dynamic"))
+    conversation = relationship("Conversation", back_populates="messages")
+    sender = relationship("User", back_populates="sent_messages")
+
+    @validates("content")
+    def _sync_content_preview(self, key, value):
+        self.content_preview = value[:80] + "..." if value and len(value) > 80 else value
+        return value
 
     __table_args__ = (
-        Index("idx_messages_conversation", "conversation_id"),
-        Index("idx_messages_conversation_created", "conversation_id", "created_at"),
+        # Covering index for per-conversation paging and unread counts (index-only scans);
+        # it also serves plain conversation_id lookups
+        Index(
+            "idx_messages_conversation_created", "conversation_id", "created_at",
+            postgresql_include=["sender_id", "is_read", "message_type"],
+        ),
         Index("idx_messages_unread", "conversation_id", "is_read"),
         Index("idx_messages_sender", "sender_id"),
     )
 
     def __repr__(self):
-        return f"<Message(id={self.id}, conversation_id={self.conversation_id}, sender_id={self.sender_id})>"
\ No newline at end of file
+        return self._safe_repr(id="id", conversation_id="conversation_id", sender_id="sender_id")
\ No newline at end of file
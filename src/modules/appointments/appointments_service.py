@@ -1,13 +1,18 @@
 # src/modules/appointments/appointments_service.py
 """Appointments service for business logic."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import date, time
+from time import monotonic
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import delete, select, func, and_, or_, desc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, raiseload
 
+from src.common.cache.cache import APPOINTMENT_REQUESTS_NAMESPACE, bump_version
+from src.common.config import settings
 from src.models.models import (
     User, Patient, Clinician, Hospital, Department, PatientHospital,
     Appointment, AppointmentStatus as DBAppointmentStatus, AppointmentType as DBAppointmentType,
@@ -23,15 +28,45 @@ from .schemas import (
 )
 
 
+# Built once at import; the converters run for every row of a list response.
+# Explicit maps rather than Enum(value) because the DB enums have members
+# (e.g. NO_SHOW) the API doesn't expose, which fall back to a default.
+_STATUS_MAP = {
+    DBAppointmentStatus.UPCOMING: AppointmentStatus.UPCOMING,
+    DBAppointmentStatus.COMPLETED: AppointmentStatus.COMPLETED,
+    DBAppointmentStatus.CANCELLED: AppointmentStatus.CANCELLED,
+    DBAppointmentStatus.IN_PROGRESS: AppointmentStatus.IN_PROGRESS,
+}
+
+
 def _convert_status(db_status: DBAppointmentStatus) -> AppointmentStatus:
     """Convert database status to schema status."""
-    mapping = {
-        DBAppointmentStatus.UPCOMING: AppointmentStatus.UPCOMING,
-        DBAppointmentStatus.COMPLETED: AppointmentStatus.COMPLETED,
-        DBAppointmentStatus.CANCELLED: AppointmentStatus.CANCELLED,
-        DBAppointmentStatus.IN_PROGRESS: AppointmentStatus.IN_PROGRESS,
-    }
-    return mapping.get(db_status, AppointmentStatus.UPCOMING)
+    return _STATUS_MAP.get(db_status, AppointmentStatus.UPCOMING)
+
+
+# Request-side lookups: query-string filters and schema enums to DB enums
+_STATUS_FILTER_MAP = {
+    "upcoming": DBAppointmentStatus.UPCOMING,
+    "completed": DBAppointmentStatus.COMPLETED,
+    "cancelled": DBAppointmentStatus.CANCELLED,
+}
+
+_REQUEST_STATUS_FILTER_MAP = {
+    "pending": DBRequestStatus.PENDING,
+    "approved": DBRequestStatus.APPROVED,
+    "rejected": DBRequestStatus.REJECTED,
+}
+
+_DB_TYPE_MAP = {
+    AppointmentType.IN_PERSON: DBAppointmentType.IN_PERSON,
+    AppointmentType.VIDEO: DBAppointmentType.VIDEO,
+}
+
+_DB_URGENCY_MAP = {
+    UrgencyLevel.LOW: DBUrgencyLevel.LOW,
+    UrgencyLevel.NORMAL: DBUrgencyLevel.NORMAL,
+    UrgencyLevel.URGENT: DBUrgencyLevel.URGENT,
+}
 
 
 def _convert_type(db_type: DBAppointmentType) -> AppointmentType:
@@ -41,44 +76,83 @@ def _convert_type(db_type: DBAppointmentType) -> AppointmentType:
     return AppointmentType.IN_PERSON
 
 
-async def _build_appointment_response(
+# With STRICT_ORM_LOADING on, touching any relationship a query did not
+# eager-load raises instead of silently issuing another SELECT.
+_STRICT_LOADING = (raiseload("*"),) if settings.STRICT_ORM_LOADING else ()
+
+
+# Everything _build_appointment_response reads, joined into the same statement;
+# these are all many-to-one, so the join never multiplies rows under LIMIT
+_APPOINTMENT_LOAD_OPTIONS = (
+    joinedload(Appointment.clinician).joinedload(Clinician.user),
+    joinedload(Appointment.hospital),
+    *_STRICT_LOADING,
+)
+
+
+# Read-only list variant: the same joins, trimmed to the columns the response shows
+# (clinician and user rows are wide, and the list never writes back to them)
+_APPOINTMENT_LIST_OPTIONS = (
+    load_only(
+        Appointment.id, Appointment.clinician_id, Appointment.hospital_id,
+        Appointment.scheduled_date, Appointment.scheduled_time, Appointment.duration_minutes,
+        Appointment.type, Appointment.status, Appointment.location, Appointment.notes,
+        Appointment.cancellation_reason, Appointment.created_at,
+    ),
+    joinedload(Appointment.clinician)
+    .load_only(Clinician.specialty)
+    .joinedload(Clinician.user)
+    .load_only(User.first_name, User.last_name),
+    joinedload(Appointment.hospital).load_only(Hospital.name),
+    *_STRICT_LOADING,
+)
+
+
+def _appointment_query():
+    """Select appointments for listing, with only what the response needs loaded up front."""
+    return select(Appointment).options(*_APPOINTMENT_LIST_OPTIONS)
+
+
+async def _get_patient_appointment(
     session: AsyncSession,
-    appointment: Appointment
-) -> AppointmentResponse:
-    """Build appointment response with clinician and hospital info."""
+    patient: Patient,
+    appointment_id: UUID
+) -> Optional[Appointment]:
+    """Fetch one of the patient's appointments by primary key (identity map first)."""
+    appointment = await session.get(Appointment, appointment_id, options=_APPOINTMENT_LOAD_OPTIONS)
+    if not appointment or appointment.patient_id != patient.id:
+        return None
+    return appointment
+
+
+def _fmt_time(t: time) -> str:
+    """Format a time as ``"09:30 AM"``; same output as strftime("%I:%M %p") without the format parse."""
+    return f"{(t.hour % 12) or 12:02d}:{t.minute:02d} {'AM' if t.hour < 12 else 'PM'}"
+
+
+def _build_appointment_response(appointment: Appointment) -> AppointmentResponse:
+    """Build appointment response from an appointment with clinician.user and hospital loaded."""
     # Get clinician info
     doctor_name = "Unknown"
     specialty = None
-    if appointment.clinician_id:
-        clinician_result = await session.execute(
-            select(Clinician, User)
-            .join(User, Clinician.user_id == User.id)
-            .where(Clinician.id == appointment.clinician_id)
-        )
-        clinician_data = clinician_result.first()
-        if clinician_data:
-            clinician, user = clinician_data
-            doctor_name = f"Dr. {user.first_name} {user.last_name}"
-            specialty = clinician.specialty
+    clinician = appointment.clinician
+    if clinician and clinician.user:
+        doctor_name = f"Dr. {clinician.user.first_name} {clinician.user.last_name}"
+        specialty = clinician.specialty
     
     # Get hospital info
-    hospital_name = None
-    if appointment.hospital_id:
-        hospital_result = await session.execute(
-            select(Hospital).where(Hospital.id == appointment.hospital_id)
-        )
-        hospital = hospital_result.scalar_one_or_none()
-        if hospital:
-            hospital_name = hospital.name
+    hospital_name = appointment.hospital.name if appointment.hospital else None
     
-    return AppointmentResponse(
+    # Every value below comes from our own rows and is already the schema type
+    # (enums via the converters), so skip re-validating each list row
+    return AppointmentResponse.model_construct(
         id=appointment.id,
         doctor_name=doctor_name,
         specialty=specialty,
         hospital_name=hospital_name,
         location=appointment.location,
         scheduled_date=appointment.scheduled_date,
-        scheduled_time=appointment.scheduled_time.strftime("%I:%M %p") if appointment.scheduled_time else "",
+        scheduled_time=_fmt_time(appointment.scheduled_time) if appointment.scheduled_time else "",
         duration_minutes=appointment.duration_minutes,
         type=_convert_type(appointment.type),
         status=_convert_status(appointment.status),
@@ -96,47 +170,41 @@ async def get_patient_appointments(
     per_page: int = 20
 ) -> AppointmentListResponse:
     """Get patient's appointments with optional status filter."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentListResponse(appointments=[], total=0, page=page, per_page=per_page)
     
-    # Build query
-    query = select(Appointment).where(Appointment.patient_id == patient.id)
+    # Build filters
+    filters = [Appointment.patient_id == patient.id]
     
     # Apply status filter
-    if status and status != "all":
-        status_map = {
-            "upcoming": DBAppointmentStatus.UPCOMING,
-            "completed": DBAppointmentStatus.COMPLETED,
-            "cancelled": DBAppointmentStatus.CANCELLED,
-        }
-        if status in status_map:
-            query = query.where(Appointment.status == status_map[status])
-    
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await session.execute(count_query)
-    total = total_result.scalar() or 0
-    
-    # Apply ordering and pagination
-    query = query.order_by(desc(Appointment.scheduled_date), desc(Appointment.scheduled_time))
-    query = query.offset((page - 1) * per_page).limit(per_page)
-    
-    result = await session.execute(query)
-    appointments = result.scalars().all()
+    if status in _STATUS_FILTER_MAP:
+        filters.append(Appointment.status == _STATUS_FILTER_MAP[status])
+    
+    # Fetch the page with the total as a window column, so one round trip covers both
+    # (the eager loads are many-to-one joins and don't change the row count)
+    query = (
+        _appointment_query()
+        .add_columns(func.count().over().label("total"))
+        .where(*filters)
+        .order_by(desc(Appointment.scheduled_date), desc(Appointment.scheduled_time))
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    rows = (await session.execute(query)).all()
     
-    # Build responses
-    appointment_responses = []
-    for apt in appointments:
-        response = await _build_appointment_response(session, apt)
-        appointment_responses.append(response)
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page there are no rows to carry the window total
+        count_query = select(func.count()).select_from(Appointment).where(*filters)
+        total = (await session.execute(count_query)).scalar() or 0
+    else:
+        total = 0
     
     return AppointmentListResponse(
-        appointments=appointment_responses,
+        appointments=[_build_appointment_response(row.Appointment) for row in rows],
         total=total,
         page=page,
         per_page=per_page
@@ -149,25 +217,17 @@ async def get_appointment_by_id(
     appointment_id: UUID
 ) -> Optional[AppointmentResponse]:
     """Get a single appointment by ID."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return None
     
     # Get appointment
-    result = await session.execute(
-        select(Appointment)
-        .where(Appointment.id == appointment_id)
-        .where(Appointment.patient_id == patient.id)
-    )
-    appointment = result.scalar_one_or_none()
+    appointment = await _get_patient_appointment(session, patient, appointment_id)
     if not appointment:
         return None
     
-    return await _build_appointment_response(session, appointment)
+    return _build_appointment_response(appointment)
 
 
 async def create_appointment(
@@ -176,32 +236,39 @@ async def create_appointment(
     request: AppointmentCreateRequest
 ) -> AppointmentActionResponse:
     """Create a new appointment."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentActionResponse(success=False, message="Patient profile not found")
     
     # Convert type
-    db_type = DBAppointmentType.VIDEO if request.type == AppointmentType.VIDEO else DBAppointmentType.IN_PERSON
-    
-    # Get hospital location if provided
-    location = None
-    if request.hospital_id:
-        hospital_result = await session.execute(
-            select(Hospital).where(Hospital.id == request.hospital_id)
+    db_type = _DB_TYPE_MAP.get(request.type, DBAppointmentType.IN_PERSON)
+    
+    # Load what the response shows now, so the new row needs no reload after the insert.
+    # Both lookups share one round trip: a single row anchored on the patient, with the
+    # hospital and clinician each LEFT JOINed by primary key.
+    hospital = clinician = None
+    if request.hospital_id or request.clinician_id:
+        lookup_result = await session.execute(
+            select(Hospital, Clinician)
+            .select_from(Patient)
+            .outerjoin(Hospital, Hospital.id == request.hospital_id)
+            .outerjoin(Clinician, Clinician.id == request.clinician_id)
+            .options(joinedload(Clinician.user))
+            .where(Patient.id == patient.id)
         )
-        hospital = hospital_result.scalar_one_or_none()
-        if hospital:
-            location = f"{hospital.name}, {hospital.city}"
+        hospital, clinician = lookup_result.one()
+    if request.hospital_id and not hospital:
+        return AppointmentActionResponse(success=False, message="Hospital not found")
+    if request.clinician_id and not clinician:
+        return AppointmentActionResponse(success=False, message="Clinician not found")
+    location = f"{hospital.name}, {hospital.city}" if hospital else None
     
     # Create appointment
     appointment = Appointment(
         patient_id=patient.id,
-        clinician_id=request.clinician_id,
-        hospital_id=request.hospital_id,
+        clinician=clinician,
+        hospital=hospital,
         department_id=request.department_id,
         scheduled_date=request.scheduled_date,
         scheduled_time=request.scheduled_time,
@@ -212,11 +279,16 @@ async def create_appointment(
         notes=request.notes
     )
     session.add(appointment)
-    await session.flush()
-    await session.refresh(appointment)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if not Appointment.is_slot_conflict(e):
+            raise
+        return AppointmentActionResponse(success=False, message="The clinician is already booked at that time")
     
-    response = await _build_appointment_response(session, appointment)
-    await session.commit()
+    # Server defaults came back with the INSERT (eager_defaults); relationships were set above
+    response = _build_appointment_response(appointment)
     
     return AppointmentActionResponse(
         success=True,
@@ -232,21 +304,13 @@ async def update_appointment(
     request: AppointmentUpdateRequest
 ) -> AppointmentActionResponse:
     """Update appointment details."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentActionResponse(success=False, message="Patient profile not found")
     
     # Get appointment
-    result = await session.execute(
-        select(Appointment)
-        .where(Appointment.id == appointment_id)
-        .where(Appointment.patient_id == patient.id)
-    )
-    appointment = result.scalar_one_or_none()
+    appointment = await _get_patient_appointment(session, patient, appointment_id)
     if not appointment:
         return AppointmentActionResponse(success=False, message="Appointment not found")
     
@@ -254,11 +318,10 @@ async def update_appointment(
     if request.notes is not None:
         appointment.notes = request.notes
     if request.type is not None:
-        appointment.type = DBAppointmentType.VIDEO if request.type == AppointmentType.VIDEO else DBAppointmentType.IN_PERSON
+        appointment.type = _DB_TYPE_MAP.get(request.type, DBAppointmentType.IN_PERSON)
     
-    await session.flush()
-    response = await _build_appointment_response(session, appointment)
     await session.commit()
+    response = _build_appointment_response(appointment)
     
     return AppointmentActionResponse(
         success=True,
@@ -274,21 +337,13 @@ async def reschedule_appointment(
     request: AppointmentRescheduleRequest
 ) -> AppointmentActionResponse:
     """Reschedule an appointment."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentActionResponse(success=False, message="Patient profile not found")
     
     # Get appointment
-    result = await session.execute(
-        select(Appointment)
-        .where(Appointment.id == appointment_id)
-        .where(Appointment.patient_id == patient.id)
-    )
-    appointment = result.scalar_one_or_none()
+    appointment = await _get_patient_appointment(session, patient, appointment_id)
     if not appointment:
         return AppointmentActionResponse(success=False, message="Appointment not found")
     
@@ -302,9 +357,14 @@ async def reschedule_appointment(
     appointment.scheduled_date = request.scheduled_date
     appointment.scheduled_time = request.scheduled_time
     
-    await session.flush()
-    response = await _build_appointment_response(session, appointment)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if not Appointment.is_slot_conflict(e):
+            raise
+        return AppointmentActionResponse(success=False, message="The clinician is already booked at that time")
+    response = _build_appointment_response(appointment)
     
     return AppointmentActionResponse(
         success=True,
@@ -320,21 +380,13 @@ async def cancel_appointment(
     reason: Optional[str] = None
 ) -> AppointmentActionResponse:
     """Cancel an appointment."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentActionResponse(success=False, message="Patient profile not found")
     
     # Get appointment
-    result = await session.execute(
-        select(Appointment)
-        .where(Appointment.id == appointment_id)
-        .where(Appointment.patient_id == patient.id)
-    )
-    appointment = result.scalar_one_or_none()
+    appointment = await _get_patient_appointment(session, patient, appointment_id)
     if not appointment:
         return AppointmentActionResponse(success=False, message="Appointment not found")
     
@@ -348,9 +400,8 @@ async def cancel_appointment(
     appointment.status = DBAppointmentStatus.CANCELLED
     appointment.cancellation_reason = reason
     
-    await session.flush()
-    response = await _build_appointment_response(session, appointment)
     await session.commit()
+    response = _build_appointment_response(appointment)
     
     return AppointmentActionResponse(
         success=True,
@@ -363,42 +414,34 @@ async def cancel_appointment(
 # APPOINTMENT REQUEST FUNCTIONS
 # ============================================================================
 
+_URGENCY_MAP = {
+    DBUrgencyLevel.LOW: UrgencyLevel.LOW,
+    DBUrgencyLevel.NORMAL: UrgencyLevel.NORMAL,
+    DBUrgencyLevel.URGENT: UrgencyLevel.URGENT,
+}
+
+_REQUEST_STATUS_MAP = {
+    DBRequestStatus.PENDING: RequestStatus.PENDING,
+    DBRequestStatus.APPROVED: RequestStatus.APPROVED,
+    DBRequestStatus.REJECTED: RequestStatus.REJECTED,
+}
+
+
 def _convert_urgency(db_urgency: DBUrgencyLevel) -> UrgencyLevel:
     """Convert database urgency to schema urgency."""
-    mapping = {
-        DBUrgencyLevel.LOW: UrgencyLevel.LOW,
-        DBUrgencyLevel.NORMAL: UrgencyLevel.NORMAL,
-        DBUrgencyLevel.URGENT: UrgencyLevel.URGENT,
-    }
-    return mapping.get(db_urgency, UrgencyLevel.NORMAL)
+    return _URGENCY_MAP.get(db_urgency, UrgencyLevel.NORMAL)
 
 
 def _convert_request_status(db_status: DBRequestStatus) -> RequestStatus:
     """Convert database request status to schema status."""
-    mapping = {
-        DBRequestStatus.PENDING: RequestStatus.PENDING,
-        DBRequestStatus.APPROVED: RequestStatus.APPROVED,
-        DBRequestStatus.REJECTED: RequestStatus.REJECTED,
-    }
-    return mapping.get(db_status, RequestStatus.PENDING)
+    return _REQUEST_STATUS_MAP.get(db_status, RequestStatus.PENDING)
 
 
-async def _build_request_response(
-    session: AsyncSession,
-    request: AppointmentRequest
-) -> AppointmentRequestResponse:
-    """Build appointment request response with hospital info."""
-    # Get hospital name
-    hospital_name = "Unknown"
-    if request.hospital_id:
-        hospital_result = await session.execute(
-            select(Hospital).where(Hospital.id == request.hospital_id)
-        )
-        hospital = hospital_result.scalar_one_or_none()
-        if hospital:
-            hospital_name = hospital.name
+def _build_request_response(request: AppointmentRequest) -> AppointmentRequestResponse:
+    """Build appointment request response; expects ``request.hospital`` to be loaded."""
+    hospital_name = request.hospital.name if request.hospital else "Unknown"
     
-    return AppointmentRequestResponse(
+    return AppointmentRequestResponse.model_construct(
         id=request.id,
         hospital_id=request.hospital_id,
         hospital_name=hospital_name,
@@ -418,37 +461,28 @@ async def get_appointment_requests(
     status: Optional[str] = None
 ) -> AppointmentRequestListResponse:
     """Get patient's appointment requests."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentRequestListResponse(requests=[], total=0)
     
     # Build query
-    query = select(AppointmentRequest).where(AppointmentRequest.patient_id == patient.id)
+    query = (
+        select(AppointmentRequest)
+        .options(joinedload(AppointmentRequest.hospital), *_STRICT_LOADING)
+        .where(AppointmentRequest.patient_id == patient.id)
+    )
     
     # Apply status filter
-    if status and status != "all":
-        status_map = {
-            "pending": DBRequestStatus.PENDING,
-            "approved": DBRequestStatus.APPROVED,
-            "rejected": DBRequestStatus.REJECTED,
-        }
-        if status in status_map:
-            query = query.where(AppointmentRequest.status == status_map[status])
+    if status in _REQUEST_STATUS_FILTER_MAP:
+        query = query.where(AppointmentRequest.status == _REQUEST_STATUS_FILTER_MAP[status])
     
     query = query.order_by(desc(AppointmentRequest.created_at))
     
     result = await session.execute(query)
     requests = result.scalars().all()
     
-    # Build responses
-    request_responses = []
-    for req in requests:
-        response = await _build_request_response(session, req)
-        request_responses.append(response)
+    request_responses = [_build_request_response(req) for req in requests]
     
     return AppointmentRequestListResponse(
         requests=request_responses,
@@ -462,17 +496,15 @@ async def create_appointment_request(
     request: AppointmentRequestCreate
 ) -> AppointmentRequestActionResponse:
     """Create a new appointment request."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentRequestActionResponse(success=False, message="Patient profile not found")
     
     # Verify patient is linked to hospital
     link_result = await session.execute(
         select(PatientHospital)
+        .options(joinedload(PatientHospital.hospital))
         .where(PatientHospital.patient_id == patient.id)
         .where(PatientHospital.hospital_id == request.hospital_id)
     )
@@ -481,18 +513,13 @@ async def create_appointment_request(
         return AppointmentRequestActionResponse(success=False, message="You must be linked to this hospital to request an appointment")
     
     # Convert types
-    db_type = DBAppointmentType.VIDEO if request.preferred_type == AppointmentType.VIDEO else DBAppointmentType.IN_PERSON
-    urgency_map = {
-        UrgencyLevel.LOW: DBUrgencyLevel.LOW,
-        UrgencyLevel.NORMAL: DBUrgencyLevel.NORMAL,
-        UrgencyLevel.URGENT: DBUrgencyLevel.URGENT,
-    }
-    db_urgency = urgency_map.get(request.urgency, DBUrgencyLevel.NORMAL)
+    db_type = _DB_TYPE_MAP.get(request.preferred_type, DBAppointmentType.IN_PERSON)
+    db_urgency = _DB_URGENCY_MAP.get(request.urgency, DBUrgencyLevel.NORMAL)
     
     # Create request
     apt_request = AppointmentRequest(
         patient_id=patient.id,
-        hospital_id=request.hospital_id,
+        hospital=link.hospital,
         department=request.department,
         reason=request.reason,
         preferred_type=db_type,
@@ -500,11 +527,11 @@ async def create_appointment_request(
         status=DBRequestStatus.PENDING
     )
     session.add(apt_request)
-    await session.flush()
-    await session.refresh(apt_request)
-    
-    response = await _build_request_response(session, apt_request)
     await session.commit()
+    await bump_version(APPOINTMENT_REQUESTS_NAMESPACE)
+    
+    # Server defaults came back with the INSERT (eager_defaults); the hospital rode in on the link
+    response = _build_request_response(apt_request)
     
     return AppointmentRequestActionResponse(
         success=True,
@@ -519,30 +546,33 @@ async def cancel_appointment_request(
     request_id: UUID
 ) -> AppointmentRequestActionResponse:
     """Cancel a pending appointment request."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return AppointmentRequestActionResponse(success=False, message="Patient profile not found")
     
-    # Get request
-    result = await session.execute(
-        select(AppointmentRequest)
+    # Delete in one statement with ownership and status in the WHERE; unlike
+    # session.delete() this doesn't load the row and its appointment first
+    deleted = await session.scalar(
+        delete(AppointmentRequest)
         .where(AppointmentRequest.id == request_id)
         .where(AppointmentRequest.patient_id == patient.id)
+        .where(AppointmentRequest.status == DBRequestStatus.PENDING)
+        .returning(AppointmentRequest.id)
     )
-    apt_request = result.scalar_one_or_none()
-    if not apt_request:
-        return AppointmentRequestActionResponse(success=False, message="Request not found")
-    
-    if apt_request.status != DBRequestStatus.PENDING:
+    if deleted is None:
+        # Only the failure path pays for working out why
+        current_status = await session.scalar(
+            select(AppointmentRequest.status)
+            .where(AppointmentRequest.id == request_id)
+            .where(AppointmentRequest.patient_id == patient.id)
+        )
+        if current_status is None:
+            return AppointmentRequestActionResponse(success=False, message="Request not found")
         return AppointmentRequestActionResponse(success=False, message="Only pending requests can be cancelled")
     
-    # Delete the request
-    await session.delete(apt_request)
     await session.commit()
+    await bump_version(APPOINTMENT_REQUESTS_NAMESPACE)
     
     return AppointmentRequestActionResponse(
         success=True,
@@ -554,47 +584,77 @@ async def cancel_appointment_request(
 # LINKED HOSPITALS WITH DEPARTMENTS
 # ============================================================================
 
+# Active departments per hospital, shared by every request this worker serves.
+# Departments only change through seeding/admin scripts, so a short TTL bounds
+# how stale a list can get without any invalidation hooks.
+_departments_cache: Dict[UUID, Tuple[float, List[DepartmentInfo]]] = {}
+
+
+async def _get_active_departments(
+    session: AsyncSession,
+    hospital_ids: List[UUID]
+) -> Dict[UUID, List[DepartmentInfo]]:
+    """Active departments for each hospital, from the cache where fresh and one query for the rest."""
+    now = monotonic()
+    departments = {}
+    missing = []
+    for hospital_id in hospital_ids:
+        cached = _departments_cache.get(hospital_id)
+        if cached and cached[0] > now:
+            departments[hospital_id] = cached[1]
+        else:
+            missing.append(hospital_id)
+    
+    if missing:
+        for hospital_id in missing:
+            departments[hospital_id] = []
+        result = await session.execute(
+            select(Department.hospital_id, Department.id, Department.name)
+            .where(Department.hospital_id.in_(missing))
+            .where(Department.is_active == True)
+        )
+        for row in result:
+            departments[row.hospital_id].append(DepartmentInfo(id=row.id, name=row.name))
+        
+        ttl = settings.DEPARTMENT_CACHE_TTL_SECONDS
+        if ttl > 0:
+            for hospital_id in missing:
+                _departments_cache[hospital_id] = (now + ttl, departments[hospital_id])
+    
+    return departments
+
+
 async def get_linked_hospitals_with_departments(
     session: AsyncSession,
     user: User
 ) -> LinkedHospitalsResponse:
     """Get patient's linked hospitals with their departments."""
-    # Get patient
-    patient_result = await session.execute(
-        select(Patient).where(Patient.user_id == user.id)
-    )
-    patient = patient_result.scalar_one_or_none()
+    # Get patient (joined onto the user by get_current_user)
+    patient = user.patient
     if not patient:
         return LinkedHospitalsResponse(hospitals=[])
     
-    # Get linked hospitals
-    links_result = await session.execute(
-        select(PatientHospital, Hospital)
-        .join(Hospital, PatientHospital.hospital_id == Hospital.id)
+    # Get linked hospitals (just the columns shown)
+    hospitals_result = await session.execute(
+        select(Hospital.id, Hospital.name, Hospital.city)
+        .join(PatientHospital, PatientHospital.hospital_id == Hospital.id)
         .where(PatientHospital.patient_id == patient.id)
         .where(Hospital.is_active == True)
     )
-    hospital_links = links_result.all()
+    linked = hospitals_result.all()
+    
+    # Departments come from the worker cache; only cold hospitals cost a query
+    departments = await _get_active_departments(session, [h.id for h in linked])
     
     # Build responses with departments
-    hospitals = []
-    for link, hospital in hospital_links:
-        # Get departments for this hospital
-        dept_result = await session.execute(
-            select(Department)
-            .where(Department.hospital_id == hospital.id)
-            .where(Department.is_active == True)
-        )
-        departments = [
-            DepartmentInfo(id=d.id, name=d.name)
-            for d in dept_result.scalars().all()
-        ]
-        
-        hospitals.append(LinkedHospitalWithDepartments(
+    hospitals = [
+        LinkedHospitalWithDepartments(
             id=hospital.id,
             name=hospital.name,
             city=hospital.city,
-            departments=departments
-        ))
+            departments=departments[hospital.id]
+        )
+        for hospital in linked
+    ]
     
     return LinkedHospitalsResponse(hospitals=hospitals)
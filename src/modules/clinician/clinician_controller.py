@@ -1,7 +1,8 @@
 # src/modules/clinician/clinician_controller.py
 """Clinician controller with API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.database.database import get_db_session
@@ -15,6 +16,16 @@ from .schemas import ClinicianDashboardResponse, PatientsListResponse
 router = APIRouter(prefix="/clinician", tags=["Clinician"])
 
 
+def _json_response(model) -> ORJSONResponse:
+    """Serialise a service result straight to JSON.
+
+    Returning a Response skips FastAPI's dump/re-validate/serialise pass over
+    response_model, which dominates on the larger dashboard payloads; the
+    response_model stays on the route for the OpenAPI schema.
+    """
+    return ORJSONResponse(content=model.model_dump())
+
+
 @router.get("", response_model=ClinicianDashboardResponse)
 async def get_clinician_dashboard(
     current_user: User = Depends(get_current_user),
@@ -27,10 +38,7 @@ async def get_clinician_dashboard(
     - Points summary and breakdown
     - Recent activity
     """
-    try:
-        return await service.get_clinician_dashboard(db, current_user)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _json_response(await service.get_clinician_dashboard(db, current_user))
 
 
 @router.get("/patients", response_model=PatientsListResponse)
@@ -44,10 +52,7 @@ async def get_patients(
     Returns patients who have pending, in-review, or escalated triage cases,
     including their demographics, latest triage info, and urgency level.
     """
-    try:
-        return await service.get_patients(db, current_user)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _json_response(await service.get_patients(db, current_user))
 
 
 @router.get("/patient/{patient_id}", response_model=service.PatientDetailResponse)
@@ -66,10 +71,7 @@ async def get_patient_detail(
     - Medical notes and history
     - Pending queries with AI draft responses
     """
-    try:
-        return await service.get_patient_detail(db, current_user, patient_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    return await service.get_patient_detail(db, current_user, patient_id)
 
 
 # =============================================================================
@@ -83,10 +85,7 @@ async def get_appointment_requests(
     db: AsyncSession = Depends(get_db_session)
 ):
     """Get appointment requests for nurse review."""
-    try:
-        return await service.get_appointment_requests(db, current_user, status)
-    except ValueError as e:
-        raise HTTPException(status_code=403, detail=str(e))
+    return await service.get_appointment_requests(db, current_user, status)
 
 
 @router.post("/requests/{request_id}/approve")
@@ -97,11 +96,8 @@ async def approve_appointment_request(
     db: AsyncSession = Depends(get_db_session)
 ):
     """Approve appointment request and schedule appointment."""
-    try:
-        await service.approve_appointment_request(db, current_user, request_id, data)
-        return {"message": "Appointment request approved and scheduled"}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    await service.approve_appointment_request(db, current_user, request_id, data)
+    return {"message": "Appointment request approved and scheduled"}
 
 
 @router.post("/requests/{request_id}/reject")
@@ -112,11 +108,8 @@ async def reject_appointment_request(
     db: AsyncSession = Depends(get_db_session)
 ):
     """Reject appointment request with reason."""
-    try:
-        await service.reject_appointment_request(db, current_user, request_id, data)
-        return {"message": "Appointment request rejected"}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    await service.reject_appointment_request(db, current_user, request_id, data)
+    return {"message": "Appointment request rejected"}
 
 
 # =============================================================================
@@ -129,10 +122,7 @@ async def get_sidebar_counts(
     db: AsyncSession = Depends(get_db_session)
 ):
     """Get badge counts for sidebar navigation."""
-    try:
-        return await service.get_sidebar_counts(db, current_user)
-    except ValueError as e:
-        raise HTTPException(status_code=403, detail=str(e))
+    return await service.get_sidebar_counts(db, current_user)
 
 
 # =============================================================================
@@ -146,8 +136,5 @@ async def get_doctors_by_hospital(
     db: AsyncSession = Depends(get_db_session)
 ):
     """Get list of doctors for a specific hospital for appointment scheduling."""
-    try:
-        return await service.get_doctors_by_hospital(db, hospital_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    return await service.get_doctors_by_hospital(db, hospital_id)
 
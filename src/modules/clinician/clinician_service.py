@@ -1,19 +1,24 @@
 # src/modules/clinician/clinician_service.py
 """Clinician service with business logic for nurse/doctor dashboards."""
 
-from typing import Optional, List
-from datetime import datetime, date, timedelta
+import asyncio
+from typing import Dict, Optional, List
+from datetime import datetime, date, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import Integer, Text, case, cast, select, update, func, and_, or_, desc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from src.common.cache.cache import APPOINTMENT_REQUESTS_NAMESPACE, bump_version, cached, get_version
+from src.common.config import settings
+from src.common.database.database import async_session
+from src.common.exceptions import ForbiddenError, NotFoundError, ServiceError
 from src.models.models import (
     User, Clinician, Patient, TriageCase, EscalatedQuery, ClinicianPoints,
     ClinicianRoleType, TriageStatus, TriageUrgency, EscalatedQueryStatus,
     PreferredLanguage, Appointment, HealthVitals, MedicalHistory, MedicalHistoryType,
-    AppointmentRequest, RequestStatus, UrgencyLevel, AppointmentType, AppointmentStatus, Hospital,
+    AppointmentRequest, RequestStatus, UrgencyLevel, AppointmentStatus, Hospital,
     ClinicianStatus
 )
 from src.common.llm.llm_service import LLMService
@@ -28,8 +33,16 @@ from .schemas import (
 )
 
 
-def _format_relative_time(dt) -> str:
-    """Format datetime or date as relative time string."""
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+
+
+def _format_relative_time(dt, now: Optional[datetime] = None) -> str:
+    """Format datetime or date as relative time string.
+    
+    List builders pass one aware ``now`` for every row instead of reading the clock per row.
+    """
     if not dt:
         return "Unknown"
     
@@ -37,32 +50,71 @@ def _format_relative_time(dt) -> str:
     if isinstance(dt, date) and not isinstance(dt, datetime):
         dt = datetime.combine(dt, datetime.min.time())
     
-    now = datetime.now(dt.tzinfo) if hasattr(dt, 'tzinfo') and dt.tzinfo else datetime.now()
-    diff = now - dt
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if dt.tzinfo is None:
+        # Naive values (plain dates) are local time
+        now = now.astimezone().replace(tzinfo=None)
+    seconds = (now - dt).total_seconds()
     
-    if diff.total_seconds() < 60:
+    if seconds < _MINUTE:
         return "Just now"
-    elif diff.total_seconds() < 3600:
-        mins = int(diff.total_seconds() / 60)
+    elif seconds < _HOUR:
+        mins = int(seconds / _MINUTE)
         return f"{mins} min{'s' if mins != 1 else ''} ago"
-    elif diff.total_seconds() < 86400:
-        hours = int(diff.total_seconds() / 3600)
+    elif seconds < _DAY:
+        hours = int(seconds / _HOUR)
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
     else:
-        days = int(diff.total_seconds() / 86400)
+        days = int(seconds / _DAY)
         return f"{days} day{'s' if days != 1 else ''} ago"
 
 
+async def _cached_models(key: str, model, load, ttl: Optional[int] = None):
+    """Serve a model (or list of models) from the stats cache, loading it on a miss."""
+    async def _load():
+        value = await load()
+        if isinstance(value, list):
+            return [item.model_dump(mode="json") for item in value]
+        return value.model_dump(mode="json")
+    
+    data = await cached(key, settings.CLINICIAN_STATS_CACHE_TTL_SECONDS if ttl is None else ttl, _load)
+    if isinstance(data, list):
+        return [model.model_validate(item) for item in data]
+    return model.model_validate(data)
+
+
+_URGENCY_STR = {urgency: urgency.value for urgency in TriageUrgency}
+_LANGUAGE_STR = {lang: lang.value.capitalize() for lang in PreferredLanguage}
+
+
 def _urgency_to_str(urgency: TriageUrgency) -> str:
     """Convert urgency enum to string."""
-    return urgency.value if urgency else "medium"
+    return _URGENCY_STR.get(urgency, "medium")
 
 
 def _language_to_str(lang: PreferredLanguage) -> str:
     """Convert language enum to string."""
-    if not lang:
-        return "English"
-    return lang.value.capitalize()
+    return _LANGUAGE_STR.get(lang, "English")
+
+
+async def _in_own_session(query_fn, *args):
+    """Run ``query_fn(session, *args)`` on a fresh session so it can overlap with others.
+    
+    Callers release the request session's connection before fanning out (see
+    _release_connection), so a request never holds one connection while waiting on more.
+    """
+    async with async_session() as own_session:
+        return await query_fn(own_session, *args)
+
+
+async def _release_connection(session: AsyncSession) -> None:
+    """Return the request session's connection to the pool; it checks out a new one if used again.
+    
+    Only reads have happened on it by this point, and expire_on_commit=False keeps the
+    loaded user and clinician usable after the commit.
+    """
+    await session.commit()
 
 
 async def get_clinician_dashboard(
@@ -71,37 +123,41 @@ async def get_clinician_dashboard(
 ) -> ClinicianDashboardResponse:
     """Get main dashboard data for clinician (nurse or doctor)."""
     
-    # Get clinician record
-    clinician_result = await session.execute(
-        select(Clinician)
-        .options(selectinload(Clinician.hospital))
-        .where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    # Clinician profile (with hospital) is loaded alongside the user by get_current_user
+    clinician = user.clinician
     
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ServiceError("Clinician profile not found")
     
     is_nurse = clinician.role_type == ClinicianRoleType.NURSE
     role = "nurse" if is_nurse else "doctor"
     hospital_name = clinician.hospital.name if clinician.hospital else None
     clinician_name = f"{user.first_name} {user.last_name}"
     
-    # Get stats based on role
+    # Stats and points move on a minute scale; serve them from the cache for a short TTL
+    cache_key = f"{clinician.id}:{role}:{date.today().isoformat()}"
+    
+    # The sections are independent, so each runs on its own pooled connection and the
+    # dashboard costs the slowest query rather than the sum of all of them. The request's
+    # own connection goes back first: holding it while waiting on four more would let
+    # DB_POOL_SIZE / 5 concurrent dashboards deadlock the pool until DB_POOL_TIMEOUT.
+    await _release_connection(session)
     if is_nurse:
-        stats = await _get_nurse_stats(session, clinician)
-        triage_cases = await _get_triage_cases(session, clinician)
-        escalated_queries = None
+        get_stats, get_list = _get_nurse_stats, _get_triage_cases
     else:
-        stats = await _get_doctor_stats(session, clinician)
-        triage_cases = None
-        escalated_queries = await _get_escalated_queries(session, clinician)
-    
-    # Get points summary
-    points = await _get_points_summary(session, clinician)
-    
-    # Get recent activity
-    recent_activity = await _get_recent_activity(session, clinician)
+        get_stats, get_list = _get_doctor_stats, _get_escalated_queries
+    stats, case_list, points, recent_activity = await asyncio.gather(
+        _cached_models(
+            f"clin:stats:{cache_key}", ClinicianStat, lambda: _in_own_session(get_stats, clinician)
+        ),
+        _in_own_session(get_list, clinician),
+        _cached_models(
+            f"clin:points:{cache_key}", PointsSummary, lambda: _in_own_session(_get_points_summary, clinician)
+        ),
+        _in_own_session(_get_recent_activity, clinician),
+    )
+    triage_cases = case_list if is_nurse else None
+    escalated_queries = None if is_nurse else case_list
     
     return ClinicianDashboardResponse(
         clinician_name=clinician_name,
@@ -123,52 +179,37 @@ async def _get_nurse_stats(
     today = date.today()
     yesterday = today - timedelta(days=1)
     
-    # Pending triage cases (for the hospital)
-    pending_query = select(func.count(TriageCase.id)).where(
-        and_(
-            TriageCase.status == TriageStatus.PENDING,
-            # Match hospital via patient-hospital link if needed
-        )
-    )
-    pending_result = await session.execute(pending_query)
-    pending_count = pending_result.scalar() or 0
-    
-    # Reviewed today by this clinician
-    reviewed_today_query = select(func.count(TriageCase.id)).where(
-        and_(
+    # All five counts from one scan; the WHERE keeps it to the rows any FILTER can match
+    counts_query = select(
+        func.count().filter(TriageCase.status == TriageStatus.PENDING).label("pending"),
+        func.count().filter(and_(
             TriageCase.reviewed_by == clinician.id,
             func.date(TriageCase.updated_at) == today
-        )
-    )
-    reviewed_result = await session.execute(reviewed_today_query)
-    reviewed_today = reviewed_result.scalar() or 0
-    
-    # Reviewed yesterday for comparison
-    reviewed_yesterday_query = select(func.count(TriageCase.id)).where(
-        and_(
+        )).label("reviewed_today"),
+        func.count().filter(and_(
             TriageCase.reviewed_by == clinician.id,
             func.date(TriageCase.updated_at) == yesterday
-        )
-    )
-    reviewed_yesterday_result = await session.execute(reviewed_yesterday_query)
-    reviewed_yesterday = reviewed_yesterday_result.scalar() or 0
-    
-    # Escalated cases
-    escalated_query = select(func.count(TriageCase.id)).where(
-        TriageCase.status == TriageStatus.ESCALATED
-    )
-    escalated_result = await session.execute(escalated_query)
-    escalated_count = escalated_result.scalar() or 0
-    
-    # Urgent pending
-    urgent_query = select(func.count(TriageCase.id)).where(
-        and_(
+        )).label("reviewed_yesterday"),
+        func.count().filter(TriageCase.status == TriageStatus.ESCALATED).label("escalated"),
+        func.count().filter(and_(
             TriageCase.status == TriageStatus.PENDING,
             TriageCase.urgency == TriageUrgency.HIGH
+        )).label("urgent"),
+    ).where(
+        or_(
+            TriageCase.status.in_([TriageStatus.PENDING, TriageStatus.ESCALATED]),
+            and_(
+                TriageCase.reviewed_by == clinician.id,
+                TriageCase.updated_at >= yesterday  # date vs timestamptz: same day boundary as func.date()
+            )
         )
     )
-    urgent_result = await session.execute(urgent_query)
-    urgent_count = urgent_result.scalar() or 0
+    counts = (await session.execute(counts_query)).one()
+    pending_count = counts.pending
+    reviewed_today = counts.reviewed_today
+    reviewed_yesterday = counts.reviewed_yesterday
+    escalated_count = counts.escalated
+    urgent_count = counts.urgent
     
     return [
         ClinicianStat(
@@ -202,44 +243,35 @@ async def _get_doctor_stats(
     today = date.today()
     yesterday = today - timedelta(days=1)
     
-    # Pending queries for this doctor
-    pending_query = select(func.count(EscalatedQuery.id)).where(
-        and_(
-            EscalatedQuery.status == EscalatedQueryStatus.PENDING,
-        )
-    )
-    pending_result = await session.execute(pending_query)
-    pending_count = pending_result.scalar() or 0
-    
-    # Answered today
-    answered_today_query = select(func.count(EscalatedQuery.id)).where(
-        and_(
+    # All four counts from one scan; the WHERE keeps it to the rows any FILTER can match
+    counts_query = select(
+        func.count().filter(EscalatedQuery.status == EscalatedQueryStatus.PENDING).label("pending"),
+        func.count().filter(and_(
             EscalatedQuery.answered_by == clinician.id,
             func.date(EscalatedQuery.answered_at) == today
-        )
-    )
-    answered_result = await session.execute(answered_today_query)
-    answered_today = answered_result.scalar() or 0
-    
-    # Answered yesterday
-    answered_yesterday_query = select(func.count(EscalatedQuery.id)).where(
-        and_(
+        )).label("answered_today"),
+        func.count().filter(and_(
             EscalatedQuery.answered_by == clinician.id,
             func.date(EscalatedQuery.answered_at) == yesterday
-        )
-    )
-    answered_yesterday_result = await session.execute(answered_yesterday_query)
-    answered_yesterday = answered_yesterday_result.scalar() or 0
-    
-    # Urgent pending
-    urgent_query = select(func.count(EscalatedQuery.id)).where(
-        and_(
+        )).label("answered_yesterday"),
+        func.count().filter(and_(
             EscalatedQuery.status == EscalatedQueryStatus.PENDING,
             EscalatedQuery.urgency == TriageUrgency.HIGH
+        )).label("urgent"),
+    ).where(
+        or_(
+            EscalatedQuery.status == EscalatedQueryStatus.PENDING,
+            and_(
+                EscalatedQuery.answered_by == clinician.id,
+                EscalatedQuery.answered_at >= yesterday  # date vs timestamptz: same day boundary as func.date()
+            )
         )
     )
-    urgent_result = await session.execute(urgent_query)
-    urgent_count = urgent_result.scalar() or 0
+    counts = (await session.execute(counts_query)).one()
+    pending_count = counts.pending
+    answered_today = counts.answered_today
+    answered_yesterday = counts.answered_yesterday
+    urgent_count = counts.urgent
     
     return [
         ClinicianStat(
@@ -271,44 +303,44 @@ async def _get_triage_cases(
     limit: int = 20
 ) -> List[TriageCaseResponse]:
     """Get triage cases for nurse dashboard."""
+    # Plain columns rather than entities: the list is read-only, so skip ORM hydration
     query = (
-        select(TriageCase)
-        .options(selectinload(TriageCase.patient).selectinload(Patient.user))
+        select(
+            TriageCase.id, TriageCase.symptoms, TriageCase.duration, TriageCase.urgency,
+            TriageCase.language, TriageCase.created_at, TriageCase.status, TriageCase.ai_summary,
+            Patient.display_id, User.first_name, User.last_name,
+        )
+        .join(Patient, TriageCase.patient_id == Patient.id)
+        .join(User, Patient.user_id == User.id)
         .where(
             TriageCase.status.in_([TriageStatus.PENDING, TriageStatus.IN_REVIEW])
         )
         .order_by(
-            # Urgent first, then by created_at desc
-            desc(TriageCase.urgency == TriageUrgency.HIGH),
+            # Most urgent first (enum order), newest first; matches idx_triage_cases_queue
+            desc(TriageCase.urgency),
             desc(TriageCase.created_at)
         )
         .limit(limit)
     )
     
     result = await session.execute(query)
-    cases = result.scalars().all()
-    
-    response = []
-    for case in cases:
-        patient = case.patient
-        user = patient.user if patient else None
-        patient_name = f"{user.first_name} {user.last_name}" if user else "Unknown"
-        patient_id = f"KLQ-{str(patient.id)[:4].upper()}" if patient else "Unknown"
-        
-        response.append(TriageCaseResponse(
-            id=str(case.id),
-            patient_name=patient_name,
-            patient_id=patient_id,
-            symptoms=case.symptoms or "",
-            duration=case.duration,
-            urgency=_urgency_to_str(case.urgency),
-            language=_language_to_str(case.language),
-            submitted_at=_format_relative_time(case.created_at),
-            status=case.status.value if case.status else "pending",
-            ai_summary=case.ai_summary
-        ))
     
-    return response
+    now = datetime.now(timezone.utc)
+    return [
+        TriageCaseResponse(
+            id=str(row["id"]),
+            patient_name=f"{row['first_name']} {row['last_name']}",
+            patient_id=row["display_id"],
+            symptoms=row["symptoms"] or "",
+            duration=row["duration"],
+            urgency=_urgency_to_str(row["urgency"]),
+            language=_language_to_str(row["language"]),
+            submitted_at=_format_relative_time(row["created_at"], now),
+            status=row["status"].value if row["status"] else "pending",
+            ai_summary=row["ai_summary"]
+        )
+        for row in result.mappings()
+    ]
 
 
 async def _get_escalated_queries(
@@ -318,41 +350,40 @@ async def _get_escalated_queries(
 ) -> List[EscalatedQueryResponse]:
     """Get escalated queries for doctor dashboard."""
     query = (
-        select(EscalatedQuery)
-        .options(selectinload(EscalatedQuery.patient).selectinload(Patient.user))
+        select(
+            EscalatedQuery.id, EscalatedQuery.question, EscalatedQuery.nurse_note,
+            EscalatedQuery.urgency, EscalatedQuery.created_at, EscalatedQuery.status,
+            EscalatedQuery.ai_draft, Patient.display_id, User.first_name, User.last_name,
+        )
+        .join(Patient, EscalatedQuery.patient_id == Patient.id)
+        .join(User, Patient.user_id == User.id)
         .where(
             EscalatedQuery.status == EscalatedQueryStatus.PENDING
         )
         .order_by(
-            desc(EscalatedQuery.urgency == TriageUrgency.HIGH),
+            desc(EscalatedQuery.urgency),
             desc(EscalatedQuery.created_at)
         )
         .limit(limit)
     )
     
     result = await session.execute(query)
-    queries = result.scalars().all()
-    
-    response = []
-    for q in queries:
-        patient = q.patient
-        user = patient.user if patient else None
-        patient_name = f"{user.first_name} {user.last_name}" if user else "Unknown"
-        patient_id = f"KLQ-{str(patient.id)[:4].upper()}" if patient else "Unknown"
-        
-        response.append(EscalatedQueryResponse(
-            id=str(q.id),
-            patient_name=patient_name,
-            patient_id=patient_id,
-            question=q.question or "",
-            nurse_note=q.nurse_note,
-            urgency=_urgency_to_str(q.urgency),
-            submitted_at=_format_relative_time(q.created_at),
-            status=q.status.value if q.status else "pending",
-            ai_draft=q.ai_draft
-        ))
     
-    return response
+    now = datetime.now(timezone.utc)
+    return [
+        EscalatedQueryResponse(
+            id=str(row["id"]),
+            patient_name=f"{row['first_name']} {row['last_name']}",
+            patient_id=row["display_id"],
+            question=row["question"] or "",
+            nurse_note=row["nurse_note"],
+            urgency=_urgency_to_str(row["urgency"]),
+            submitted_at=_format_relative_time(row["created_at"], now),
+            status=row["status"].value if row["status"] else "pending",
+            ai_draft=row["ai_draft"]
+        )
+        for row in result.mappings()
+    ]
 
 
 async def _get_points_summary(
@@ -364,49 +395,34 @@ async def _get_points_summary(
     current_month = today.replace(day=1)
     last_month = (current_month - timedelta(days=1)).replace(day=1)
     
-    # This month total
-    this_month_query = select(func.coalesce(func.sum(ClinicianPoints.points), 0)).where(
-        and_(
-            ClinicianPoints.clinician_id == clinician.id,
-            ClinicianPoints.month == current_month
-        )
-    )
-    this_month_result = await session.execute(this_month_query)
-    this_month_total = this_month_result.scalar() or 0
-    
-    # Last month total
-    last_month_query = select(func.coalesce(func.sum(ClinicianPoints.points), 0)).where(
-        and_(
-            ClinicianPoints.clinician_id == clinician.id,
-            ClinicianPoints.month == last_month
-        )
-    )
-    last_month_result = await session.execute(last_month_query)
-    last_month_total = last_month_result.scalar() or 0
-    
-    # Breakdown by action for current month
-    breakdown_query = (
+    # Totals for both months and this month's breakdown from one grouped scan
+    points_query = (
         select(
+            ClinicianPoints.month,
             ClinicianPoints.action,
             func.sum(ClinicianPoints.points).label("total_points"),
-            func.count(ClinicianPoints.id).label("count")
+            func.count().label("entries")
         )
         .where(
             and_(
                 ClinicianPoints.clinician_id == clinician.id,
-                ClinicianPoints.month == current_month
+                ClinicianPoints.month.in_([current_month, last_month])
             )
         )
-        .group_by(ClinicianPoints.action)
+        .group_by(ClinicianPoints.month, ClinicianPoints.action)
     )
-    breakdown_result = await session.execute(breakdown_query)
-    breakdown_rows = breakdown_result.all()
+    points_result = await session.execute(points_query)
+    points_rows = points_result.all()
+    
+    this_month_total = sum(row.total_points for row in points_rows if row.month == current_month)
+    last_month_total = sum(row.total_points for row in points_rows if row.month == last_month)
+    breakdown_rows = [row for row in points_rows if row.month == current_month]
     
     breakdown = [
         PointsBreakdown(
             action=row.action,
             points=int(row.total_points),
-            count=int(row.count)
+            count=int(row.entries)
         )
         for row in breakdown_rows
     ]
@@ -445,11 +461,12 @@ async def _get_recent_activity(
     result = await session.execute(query)
     points_history = result.scalars().all()
     
+    now = datetime.now(timezone.utc)
     activities = []
     for entry in points_history:
         activities.append(RecentActivity(
             action=entry.description or entry.action,
-            time=_format_relative_time(entry.created_at),
+            time=_format_relative_time(entry.created_at, now),
             points=f"+{entry.points}"
         ))
     
@@ -472,19 +489,47 @@ async def get_patients(
 ) -> PatientsListResponse:
     """Get list of patients with active triage cases for clinician view."""
     
-    # Get clinician record
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ServiceError("Clinician profile not found")
+    
+    # Most recent appointment date per patient (for last_visit), answered from the
+    # (patient_id, scheduled_date, ...) index as part of the same statement
+    last_appointment_date = (
+        select(func.max(Appointment.scheduled_date))
+        .where(Appointment.patient_id == Patient.id)
+        .correlate(Patient)
+        .scalar_subquery()
+        .label("last_appointment_date")
+    )
     
-    # Query patients who have active triage cases
-    # Group by patient to get their latest triage case
+    # Whole years, worked out by the server alongside the row
+    age = func.coalesce(
+        cast(func.date_part("year", func.age(Patient.date_of_birth)), Integer), 0
+    ).label("age")
+    
+    # List status and the truncated condition also come back ready to use
+    status_label = case(
+        (TriageCase.status == TriageStatus.PENDING, "pending"),
+        (TriageCase.status == TriageStatus.RESOLVED, "completed"),
+        else_="active",
+    ).label("status_label")
+    condition = case(
+        (func.length(TriageCase.symptoms) > 50, func.left(TriageCase.symptoms, 50, type_=Text) + "..."),
+        else_=TriageCase.symptoms,
+    ).label("condition")
+    
+    # Query patients who have active triage cases; DISTINCT ON keeps only each
+    # patient's latest case, so the server sends one row per patient
     query = (
-        select(Patient, TriageCase, User)
+        select(
+            Patient.id, Patient.display_id, Patient.gender,
+            User.first_name, User.last_name, User.initials,
+            TriageCase.urgency, TriageCase.created_at.label("triage_created_at"),
+            last_appointment_date, age, status_label, condition,
+        )
+        .select_from(Patient)
         .join(User, Patient.user_id == User.id)
         .join(TriageCase, TriageCase.patient_id == Patient.id)
         .where(
@@ -494,77 +539,37 @@ async def get_patients(
                 TriageStatus.ESCALATED
             ])
         )
+        .distinct(Patient.id)
         .order_by(
             Patient.id,
             desc(TriageCase.created_at)
         )
     )
     
-    result = await session.execute(query)
-    rows = result.all()
-    
-    # Deduplicate by patient and keep only the latest triage case
-    patients_dict = {}
-    for patient, triage, user_obj in rows:
-        if patient.id not in patients_dict:
-            patients_dict[patient.id] = (patient, triage, user_obj)
+    # The list is unbounded, so read it through a server-side cursor and build
+    # items as batches arrive instead of buffering every row first
+    result = await session.stream(query)
     
-    # Get most recent appointment for each patient (for last_visit calculation)
+    now = datetime.now(timezone.utc)
     patient_list = []
-    for patient, triage, user_obj in patients_dict.values():
-        # Get most recent appointment for this patient
-        appt_query = (
-            select(Appointment)
-            .where(Appointment.patient_id == patient.id)
-            .order_by(desc(Appointment.scheduled_date))
-            .limit(1)
-        )
-        appt_result = await session.execute(appt_query)
-        recent_appt = appt_result.scalar_one_or_none()
-        
-        # Calculate age from date_of_birth
-        age = 0
-        if patient.date_of_birth:
-            today = date.today()
-            age = today.year - patient.date_of_birth.year - (
-                (today.month, today.day) < (patient.date_of_birth.month, patient.date_of_birth.day)
-            )
-        
-        # Get initials for avatar
-        initials = ""
-        if user_obj.first_name and user_obj.last_name:
-            initials = f"{user_obj.first_name[0]}{user_obj.last_name[0]}".upper()
-        
+    async for row in result.mappings():
         # Determine last visit
-        last_visit = "Never"
-        if recent_appt:
-            last_visit = _format_relative_time(recent_appt.scheduled_date)
-        elif triage:
-            last_visit = _format_relative_time(triage.created_at)
-        
-        # Determine status based on triage status
-        status_map = {
-            TriageStatus.PENDING: "pending",
-            TriageStatus.IN_REVIEW: "active",
-            TriageStatus.ESCALATED: "active",
-            TriageStatus.RESOLVED: "completed"
-        }
-        status = status_map.get(triage.status, "active")
-        
-        # Get condition from symptoms (truncate if too long)
-        condition = triage.symptoms[:50] + "..." if len(triage.symptoms) > 50 else triage.symptoms
+        if row["last_appointment_date"]:
+            last_visit = _format_relative_time(row["last_appointment_date"], now)
+        else:
+            last_visit = _format_relative_time(row["triage_created_at"], now)
         
         patient_list.append(PatientListItem(
-            id=str(patient.id),
-            name=f"{user_obj.first_name} {user_obj.last_name}",
-            patient_id=f"KLQ-{str(patient.id)[:4].upper()}",
-            age=age,
-            gender=patient.gender or "Unknown",
+            id=str(row["id"]),
+            name=f"{row['first_name']} {row['last_name']}",
+            patient_id=row["display_id"],
+            age=row["age"],
+            gender=row["gender"] or "Unknown",
             last_visit=last_visit,
-            status=status,
-            urgency=_urgency_to_str(triage.urgency),
-            condition=condition,
-            avatar=initials
+            status=row["status_label"],
+            urgency=_urgency_to_str(row["urgency"]),
+            condition=row["condition"],
+            avatar=row["initials"]
         ))
     
     return PatientsListResponse(
@@ -587,61 +592,149 @@ def _calculate_age(date_of_birth: date) -> int:
     )
 
 
-async def _generate_ai_analysis(
-    session: AsyncSession,
-    triage: TriageCase,
-    patient: Patient
-) -> tuple[str, str]:
-    """Generate AI analysis for triage case if missing."""
-    if triage.ai_summary and triage.ai_summary.strip():
-        # Already has AI analysis
-        return triage.ai_summary, triage.nurse_notes or ""
+# Analyses currently being generated, by triage case id, so concurrent views of
+# the same case share one set of LLM calls instead of each starting their own
+_analysis_in_flight: Dict[UUID, "asyncio.Task[tuple[str, str]]"] = {}
+
+
+async def _run_ai_analysis(triage: TriageCase, patient: Patient) -> tuple[str, str]:
+    """Ask N-ATLaS for an assessment and recommendations for a triage case."""
+    llm = LLMService()
     
-    try:
-        # Call N-ATLaS for AI analysis
-        llm = LLMService()
-        
-        # Build patient context
-        patient_context = f"""
+    # Build patient context
+    patient_context = f"""
 Patient Age: {_calculate_age(patient.date_of_birth)} years
 Gender: {patient.gender}
 Blood Type: {patient.blood_type or 'Unknown'}
 Allergies: {patient.allergies or 'None reported'}
 """
-        
-        result = await llm.triage_symptoms(
-            symptoms=triage.symptoms,
-            language=_language_to_str(triage.language),
-            additional_info=f"Duration: {triage.duration}. {patient_context}"
-        )
-        
-        # Extract assessment as AI summary
-        ai_summary = result.get("assessment", "AI analysis unavailable")
-        
-        # Generate recommendation
-        recommendation_prompt = f"""Based on these symptoms and assessment, provide specific recommendations for the healthcare team:
+    
+    # The recommendation is asked for from the same case details rather than from the
+    # assessment, so the two calls can run side by side
+    recommendation_prompt = f"""Based on these symptoms and patient details, provide specific recommendations for the healthcare team:
 
 Symptoms: {triage.symptoms}
-Assessment: {ai_summary}
-
+Duration: {triage.duration}
+{patient_context}
 Provide 3-4 specific clinical recommendations."""
-        
-        recommendation_result = await llm.chat(
+    
+    result, recommendation_result = await asyncio.gather(
+        llm.triage_symptoms(
+            symptoms=triage.symptoms,
+            language=_language_to_str(triage.language),
+            additional_info=f"Duration: {triage.duration}. {patient_context}"
+        ),
+        llm.chat(
             user_message=recommendation_prompt,
             context="triage",
             language="english",
             temperature=0.3
-        )
-        
-        # Update triage with AI analysis
-        triage.ai_summary = ai_summary
-        await session.commit()
-        
-        return ai_summary, recommendation_result
-        
+        ),
+    )
+    
+    # Extract assessment as AI summary
+    ai_summary = result.get("assessment", "AI analysis unavailable")
+    
+    return ai_summary, recommendation_result
+
+
+async def _generate_ai_analysis(
+    session: AsyncSession,
+    triage: TriageCase,
+    patient: Patient
+) -> tuple[str, str]:
+    """Generate AI analysis for triage case if missing."""
+    if triage.ai_summary and triage.ai_summary.strip():
+        # Already has AI analysis; cases analysed before recommendations were stored fall back to the nurse notes
+        return triage.ai_summary, triage.ai_recommendation or triage.nurse_notes or ""
+    
+    task = _analysis_in_flight.get(triage.id)
+    if task is None:
+        task = asyncio.ensure_future(_run_ai_analysis(triage, patient))
+        _analysis_in_flight[triage.id] = task
+        task.add_done_callback(lambda _: _analysis_in_flight.pop(triage.id, None))
+    
+    try:
+        ai_summary, ai_recommendation = await asyncio.shield(task)
     except Exception as e:
         print(f"Error generating AI analysis: {e}")
         return "AI analysis temporarily unavailable", "Please assess based on clinical judgment"
+    
+    # Store both so later views skip the LLM; the case may have been loaded on another session
+    triage.ai_summary = ai_summary
+    triage.ai_recommendation = ai_recommendation
+    try:
+        await session.execute(
+            update(TriageCase)
+            .where(TriageCase.id == triage.id)
+            .values(ai_summary=ai_summary, ai_recommendation=ai_recommendation)
+        )
+        await session.commit()
+    except Exception as e:
+        # The analysis is still good for this response; the next view will retry the save
+        await session.rollback()
+        print(f"Error saving AI analysis: {e}")
+    
+    return ai_summary, ai_recommendation
+
+
+async def _latest_active_triage(session: AsyncSession, patient_id: UUID) -> Optional[TriageCase]:
+    """Latest open triage case for a patient."""
+    result = await session.execute(
+        select(TriageCase)
+        .where(
+            and_(
+                TriageCase.patient_id == patient_id,
+                TriageCase.status.in_([
+                    TriageStatus.PENDING,
+                    TriageStatus.IN_REVIEW,
+                    TriageStatus.ESCALATED
+                ])
+            )
+        )
+        .order_by(desc(TriageCase.created_at))
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _latest_vitals(session: AsyncSession, patient_id: UUID) -> Optional[HealthVitals]:
+    """Most recent vital signs recorded for a patient."""
+    result = await session.execute(
+        select(HealthVitals)
+        .where(HealthVitals.patient_id == patient_id)
+        .order_by(desc(HealthVitals.recorded_at))
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _recent_medical_history(session: AsyncSession, patient_id: UUID, limit: int) -> list:
+    """Latest medical history entries for a patient, each with its clinician's user (or None)."""
+    result = await session.execute(
+        select(MedicalHistory, User)
+        .join(User, MedicalHistory.clinician_id == User.id, isouter=True)
+        .where(MedicalHistory.patient_id == patient_id)
+        .order_by(desc(MedicalHistory.date))
+        .limit(limit)
+    )
+    return result.all()
+
+
+async def _pending_patient_queries(session: AsyncSession, patient_id: UUID) -> List[EscalatedQuery]:
+    """A patient's pending escalated queries, newest first."""
+    result = await session.execute(
+        select(EscalatedQuery)
+        .where(
+            and_(
+                EscalatedQuery.patient_id == patient_id,
+                EscalatedQuery.status == EscalatedQueryStatus.PENDING
+            )
+        )
+        .order_by(desc(EscalatedQuery.created_at))
+        .limit(5)
+    )
+    return result.scalars().all()
 
 
 async def get_patient_detail(
@@ -651,20 +744,16 @@ async def get_patient_detail(
 ) -> PatientDetailResponse:
     """Get comprehensive patient detail for clinician view."""
     
-    # Verify clinician
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise NotFoundError("Clinician profile not found")
     
     # Parse patient_id - accept either full UUID or KLQ-xxxx format
     try:
         patient_uuid = UUID(patient_id)
     except:
         # If not a valid UUID, might be patient record ID - query by id converted to UUID
-        raise ValueError(f"Invalid patient ID format: {patient_id}")
+        raise NotFoundError(f"Invalid patient ID format: {patient_id}")
     
     # Fetch patient with user data
     patient_query = (
@@ -676,15 +765,12 @@ async def get_patient_detail(
     row = result.first()
     
     if not row:
-        raise ValueError(f"Patient not found: {patient_id}")
+        raise NotFoundError(f"Patient not found: {patient_id}")
     
     patient, patient_user = row
     
     # Build demographics
     age = _calculate_age(patient.date_of_birth)
-    initials = ""
-    if patient_user.first_name and patient_user.last_name:
-        initials = f"{patient_user.first_name[0]}{patient_user.last_name[0]}".upper()
     
     location = f"{patient.city}, {patient.state}" if patient.city and patient.state else patient.city or patient.state or "Unknown"
     
@@ -697,7 +783,7 @@ async def get_patient_detail(
     
     demographics = PatientDemographics(
         id=str(patient.id),
-        patient_id=f"KLQ-{str(patient.id)[:4].upper()}",
+        patient_id=patient.display_id,
         name=f"{patient_user.first_name} {patient_user.last_name}",
         age=age,
         gender=patient.gender or "Unknown",
@@ -705,46 +791,29 @@ async def get_patient_detail(
         location=location,
         language=_language_to_str(patient.preferred_language),
         linked_since=linked_since,
-        avatar=initials,
+        avatar=patient_user.initials,
         blood_type=patient.blood_type,
         allergies=patient.allergies
     )
     
-    # Get latest active triage case
-    triage_detail = None
-    triage_query = (
-        select(TriageCase)
-        .where(
-            and_(
-                TriageCase.patient_id == patient.id,
-                TriageCase.status.in_([
-                    TriageStatus.PENDING,
-                    TriageStatus.IN_REVIEW,
-                    TriageStatus.ESCALATED
-                ])
-            )
-        )
-        .order_by(desc(TriageCase.created_at))
-        .limit(1)
+    # Everything below depends only on the patient, so fetch it concurrently,
+    # each query on its own pooled connection (after handing the request's back)
+    await _release_connection(session)
+    triage, latest_vitals, history_rows, queries = await asyncio.gather(
+        _in_own_session(_latest_active_triage, patient.id),
+        _in_own_session(_latest_vitals, patient.id),
+        _in_own_session(_recent_medical_history, patient.id, 20),
+        _in_own_session(_pending_patient_queries, patient.id),
     )
-    triage_result = await session.execute(triage_query)
-    triage = triage_result.scalar_one_or_none()
     
+    # Get latest active triage case
+    triage_detail = None
     if triage:
         # Generate AI analysis if missing
         ai_summary, ai_recommendation = await _generate_ai_analysis(session, triage, patient)
         
         # Get latest vital signs
         vital_signs = None
-        vitals_query = (
-            select(HealthVitals)
-            .where(HealthVitals.patient_id == patient.id)
-            .order_by(desc(HealthVitals.recorded_at))
-            .limit(1)
-        )
-        vitals_result = await session.execute(vitals_query)
-        latest_vitals = vitals_result.scalar_one_or_none()
-        
         if latest_vitals:
             bp_str = None
             if latest_vitals.blood_pressure_systolic and latest_vitals.blood_pressure_diastolic:
@@ -770,18 +839,9 @@ async def get_patient_detail(
             ai_recommendation=ai_recommendation
         )
     
-    # Get medical history (as medical notes)
+    # Get medical history (as medical notes): the newest ten of the timeline rows
     medical_notes = []
-    notes_query = (
-        select(MedicalHistory, User)
-        .join(User, MedicalHistory.clinician_id == User.id, isouter=True)
-        .where(MedicalHistory.patient_id == patient.id)
-        .order_by(desc(MedicalHistory.date))
-        .limit(10)
-    )
-    notes_result = await session.execute(notes_query)
-    
-    for history, clinician_user in notes_result:
+    for history, clinician_user in history_rows[:10]:
         doctor_name = f"Dr. {clinician_user.first_name} {clinician_user.last_name}" if clinician_user else "Unknown"
         
         # Parse description for medications and lifestyle
@@ -803,20 +863,7 @@ async def get_patient_detail(
     
     # Get pending queries
     pending_queries = []
-    queries_query = (
-        select(EscalatedQuery)
-        .where(
-            and_(
-                EscalatedQuery.patient_id == patient.id,
-                EscalatedQuery.status == EscalatedQueryStatus.PENDING
-            )
-        )
-        .order_by(desc(EscalatedQuery.created_at))
-        .limit(5)
-    )
-    queries_result = await session.execute(queries_query)
-    
-    for query in queries_result.scalars():
+    for query in queries:
         pending_queries.append(PendingQueryResponse(
             id=str(query.id),
             question=query.question,
@@ -828,28 +875,12 @@ async def get_patient_detail(
     
     # Get medical history timeline
     history_items = []
-    history_query = (
-        select(MedicalHistory, User)
-        .join(User, MedicalHistory.clinician_id == User.id, isouter=True)
-        .where(MedicalHistory.patient_id == patient.id)
-        .order_by(desc(MedicalHistory.date))
-        .limit(20)
-    )
-    history_result = await session.execute(history_query)
-    
-    type_map = {
-        MedicalHistoryType.DIAGNOSIS: "diagnosis",
-        MedicalHistoryType.PRESCRIPTION: "prescription",
-        MedicalHistoryType.TEST: "test",
-        MedicalHistoryType.CONSULTATION: "consultation"
-    }
-    
-    for history, clinician_user in history_result:
+    for history, clinician_user in history_rows:
         doctor_name = f"Dr. {clinician_user.first_name} {clinician_user.last_name}" if clinician_user else "Unknown"
         
         history_items.append(HistoryItemResponse(
             id=str(history.id),
-            type=type_map.get(history.type, "consultation"),
+            type=history.type.value if history.type else "consultation",  # enum values are the API strings
             title=history.title,
             doctor=doctor_name,
             date=history.date.strftime("%b %d, %Y"),
@@ -869,6 +900,17 @@ async def get_patient_detail(
 # APPOINTMENT REQUESTS
 # =============================================================================
 
+async def _pending_request_counts(session: AsyncSession):
+    """Pending appointment requests, and how many of them are urgent, in one aggregate."""
+    result = await session.execute(
+        select(
+            func.count().label("pending"),
+            func.count().filter(AppointmentRequest.urgency == UrgencyLevel.URGENT).label("urgent"),
+        ).where(AppointmentRequest.status == RequestStatus.PENDING)
+    )
+    return result.one()
+
+
 async def get_appointment_requests(
     session: AsyncSession,
     user: User,
@@ -876,13 +918,9 @@ async def get_appointment_requests(
 ) ->  AppointmentRequestsResponse:
     """Get appointment requests for nurse review."""
     
-    # Verify clinician (nurse)
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ForbiddenError("Clinician profile not found")
     
     # Build query
     query = (
@@ -904,38 +942,22 @@ async def get_appointment_requests(
     result = await session.execute(query)
     rows = result.all()
     
+    # The pending/urgent tallies are counted by Postgres in one cheap aggregate
+    counts = await _pending_request_counts(session)
+    
     requests_list = []
-    pending_count = 0
-    urgent_count = 0
     
     for request, patient, patient_user, hospital in rows:
         # Calculate age
         age = _calculate_age(patient.date_of_birth)
         
-        # Map urgency to string
-        urgency_map = {
-            UrgencyLevel.LOW: "low",
-            UrgencyLevel.NORMAL: "normal",
-            UrgencyLevel.URGENT: "urgent"
-        }
-        urgency_str = urgency_map.get(request.urgency, "normal")
-        
-        # Map preferred type to string
-        type_map = {
-            AppointmentType.IN_PERSON: "in-person",
-            AppointmentType.VIDEO: "video"
-        }
-        type_str = type_map.get(request.preferred_type, "in-person")
+        # Map urgency and preferred type to strings (the enum values are the API strings)
+        urgency_str = request.urgency.value if request.urgency else "normal"
+        type_str = request.preferred_type.value if request.preferred_type else "in-person"
         
         # Map status to string
         status_str = request.status.value.lower() if request.status else "pending"
         
-        # Count pending and urgent
-        if request.status == RequestStatus.PENDING:
-            pending_count += 1
-            if request.urgency == UrgencyLevel.URGENT:
-                urgent_count += 1
-        
         requests_list.append(AppointmentRequestItem(
             id=str(request.id),
             patient_name=f"{patient_user.first_name} {patient_user.last_name}",
@@ -956,11 +978,50 @@ async def get_appointment_requests(
     return AppointmentRequestsResponse(
         requests=requests_list,
         total=len(requests_list),
-        pending=pending_count,
-        urgent=urgent_count
+        pending=counts.pending,
+        urgent=counts.urgent
     )
 
 
+async def _review_pending_request(
+    session: AsyncSession,
+    request_id: str,
+    clinician: Clinician,
+    **values
+):
+    """Move a pending request to its reviewed state in one UPDATE ... RETURNING.
+    
+    The status check sits in the WHERE clause, so two clinicians reviewing the
+    same request can't both succeed. Returns the fields approval needs.
+    """
+    try:
+        request_uuid = UUID(request_id)
+    except ValueError:
+        raise ServiceError(f"Invalid appointment request ID: {request_id}")
+    result = await session.execute(
+        update(AppointmentRequest)
+        .where(
+            AppointmentRequest.id == request_uuid,
+            AppointmentRequest.status == RequestStatus.PENDING
+        )
+        .values(reviewed_by=clinician.id, reviewed_at=datetime.now(), **values)
+        .returning(
+            AppointmentRequest.id, AppointmentRequest.patient_id, AppointmentRequest.hospital_id,
+            AppointmentRequest.preferred_type, AppointmentRequest.reason
+        )
+    )
+    reviewed = result.first()
+    if reviewed is None:
+        # Only the failure path pays for working out why
+        current_status = await session.scalar(
+            select(AppointmentRequest.status).where(AppointmentRequest.id == request_uuid)
+        )
+        if current_status is None:
+            raise ServiceError(f"Appointment request not found: {request_id}")
+        raise ServiceError(f"Request is already {current_status.value}")
+    return reviewed
+
+
 async def approve_appointment_request(
     session: AsyncSession,
     user: User,
@@ -969,25 +1030,15 @@ async def approve_appointment_request(
 ) -> None:
     """Approve appointment request and create scheduled appointment."""
     
-    # Verify clinician
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ServiceError("Clinician profile not found")
     
-    # Get the request
-    request_result = await session.execute(
-        select(AppointmentRequest).where(AppointmentRequest.id == UUID(request_id))
+    # Mark the request approved; the appointment below is inserted in the same transaction
+    appointment_request = await _review_pending_request(
+        session, request_id, clinician,
+        status=RequestStatus.APPROVED,
     )
-    appointment_request = request_result.scalar_one_or_none()
-    if not appointment_request:
-        raise ValueError(f"Appointment request not found: {request_id}")
-    
-    # Verify request is still pending
-    if appointment_request.status != RequestStatus.PENDING:
-        raise ValueError(f"Request is already {appointment_request.status.value}")
     
     # Create appointment - data.scheduled_date and data.scheduled_time are already date/time objects
     new_appointment = Appointment(
@@ -1004,12 +1055,14 @@ async def approve_appointment_request(
     )
     session.add(new_appointment)
     
-    # Update request status
-    appointment_request.status = RequestStatus.APPROVED
-    appointment_request.reviewed_by = clinician.id
-    appointment_request.reviewed_at = datetime.now()
-    
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if not Appointment.is_slot_conflict(e):
+            raise
+        raise ServiceError("The clinician is already booked at that time")
+    await bump_version(APPOINTMENT_REQUESTS_NAMESPACE)
 
 
 async def reject_appointment_request(
@@ -1020,33 +1073,18 @@ async def reject_appointment_request(
 ) -> None:
     """Reject appointment request with reason."""
     
-    # Verify clinician
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ServiceError("Clinician profile not found")
     
-    # Get the request
-    request_result = await session.execute(
-        select(AppointmentRequest).where(AppointmentRequest.id == UUID(request_id))
+    await _review_pending_request(
+        session, request_id, clinician,
+        status=RequestStatus.REJECTED,
+        rejection_reason=data.rejection_reason,
     )
-    appointment_request = request_result.scalar_one_or_none()
-    if not appointment_request:
-        raise ValueError(f"Appointment request not found: {request_id}")
-    
-    # Verify request is still pending
-    if appointment_request.status != RequestStatus.PENDING:
-        raise ValueError(f"Request is already {appointment_request.status.value}")
-    
-    # Update request
-    appointment_request.status = RequestStatus.REJECTED
-    appointment_request.rejection_reason = data.rejection_reason
-    appointment_request.reviewed_by = clinician.id
-    appointment_request.reviewed_at = datetime.now()
     
     await session.commit()
+    await bump_version(APPOINTMENT_REQUESTS_NAMESPACE)
 # =============================================================================
 # SIDEBAR COUNTS
 # =============================================================================
@@ -1057,57 +1095,52 @@ async def get_sidebar_counts(
 ) -> SidebarCountsResponse:
     """Get badge counts for sidebar navigation."""
     
-    # Verify clinician
-    clinician_result = await session.execute(
-        select(Clinician).where(Clinician.user_id == user.id)
-    )
-    clinician = clinician_result.scalar_one_or_none()
+    clinician = user.clinician
     if not clinician:
-        raise ValueError("Clinician profile not found")
+        raise ForbiddenError("Clinician profile not found")
     
     is_nurse = clinician.role_type == ClinicianRoleType.NURSE
+    role = "nurse" if is_nurse else "doctor"
     
-    # Count active patients (those with pending/in-review/escalated triage cases)
-    patients_query = (
-        select(func.count(func.distinct(Patient.id)))
-        .select_from(TriageCase)
-        .join(Patient, TriageCase.patient_id == Patient.id)
-        .where(
-            TriageCase.status.in_([
-                TriageStatus.PENDING,
-                TriageStatus.IN_REVIEW,
-                TriageStatus.ESCALATED
-            ])
+    # The badges are hospital-wide counts, so every clinician in a role shares one entry
+    async def _load_counts() -> SidebarCountsResponse:
+        # Active patients (those with pending/in-review/escalated triage cases)
+        patients_count = (
+            select(func.count(func.distinct(TriageCase.patient_id)))
+            .where(
+                TriageCase.status.in_([
+                    TriageStatus.PENDING,
+                    TriageStatus.IN_REVIEW,
+                    TriageStatus.ESCALATED
+                ])
+            )
+            .scalar_subquery()
         )
-    )
-    patients_result = await session.execute(patients_query)
-    patients_count = patients_result.scalar() or 0
+        # Role badge: pending appointment requests for nurses, pending escalated queries for doctors
+        if is_nurse:
+            role_count = (
+                select(func.count(AppointmentRequest.id))
+                .where(AppointmentRequest.status == RequestStatus.PENDING)
+                .scalar_subquery()
+            )
+        else:
+            role_count = (
+                select(func.count(EscalatedQuery.id))
+                .where(EscalatedQuery.status == EscalatedQueryStatus.PENDING)
+                .scalar_subquery()
+            )
     
-    # Count pending appointment requests (nurses only)
-    requests_count = 0
-    if is_nurse:
-        requests_query = (
-            select(func.count(AppointmentRequest.id))
-            .where(AppointmentRequest.status == RequestStatus.PENDING)
-        )
-        requests_result = await session.execute(requests_query)
-        requests_count = requests_result.scalar() or 0
-    
-    # Count pending escalated queries (doctors only)
-    pending_queries_count = 0
-    if not is_nurse:
-        queries_query = (
-            select(func.count(EscalatedQuery.id))
-            .where(EscalatedQuery.status == EscalatedQueryStatus.PENDING)
+        # Both counts in one round trip
+        counts = (await session.execute(select(patients_count, role_count))).one()
+    
+        return SidebarCountsResponse(
+            patients_count=counts[0] or 0,
+            requests_count=counts[1] or 0 if is_nurse else 0,
+            pending_queries_count=0 if is_nurse else counts[1] or 0
         )
-        queries_result = await session.execute(queries_query)
-        pending_queries_count = queries_result.scalar() or 0
     
-    return SidebarCountsResponse(
-        patients_count=patients_count,
-        requests_count=requests_count,
-        pending_queries_count=pending_queries_count
-    )
+    version = await get_version(APPOINTMENT_REQUESTS_NAMESPACE)
+    return await _cached_models(f"clin:sidebar:{role}:v{version}", SidebarCountsResponse, _load_counts)
 # =============================================================================
 # DOCTORS LIST
 # =============================================================================
@@ -1117,14 +1150,29 @@ async def get_doctors_by_hospital(
     hospital_id: str
 ) -> List[DoctorListItem]:
     """Get list of doctors for a specific hospital."""
-    
+    try:
+        hospital_uuid = UUID(hospital_id)
+    except ValueError:
+        raise NotFoundError(f"Hospital not found: {hospital_id}")
+    
+    # The roster only changes with staff turnover, so a few minutes' staleness is fine
+    return await _cached_models(
+        f"clin:doctors:{hospital_uuid}",
+        DoctorListItem,
+        lambda: _load_doctors(session, hospital_uuid),
+        ttl=settings.DOCTORS_CACHE_TTL_SECONDS,
+    )
+
+
+async def _load_doctors(session: AsyncSession, hospital_uuid: UUID) -> List[DoctorListItem]:
+    """Query the active doctors at a hospital."""
     # Query doctors (clinicians with role_type=DOCTOR) at the given hospital
     result = await session.execute(
         select(Clinician, User)
         .join(User, Clinician.user_id == User.id)
         .where(
             and_(
-                Clinician.hospital_id == UUID(hospital_id),
+                Clinician.hospital_id == hospital_uuid,
                 Clinician.role_type == ClinicianRoleType.DOCTOR,
                 Clinician.status == ClinicianStatus.ACTIVE
             )
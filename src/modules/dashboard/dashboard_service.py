@@ -8,7 +8,7 @@ import json
 
 from sqlalchemy import select, func, or_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from src.models.models import (
     User, Patient, Hospital, Department, PatientHospital, Clinician,
@@ -56,64 +56,57 @@ async def get_dashboard_data(
     # Get preferred language
     preferred_lang = patient.preferred_language.value if patient.preferred_language else "ENGLISH"
     
-    # Get upcoming appointments
+    # Get upcoming appointments with clinician and hospital loaded alongside
     appointments_result = await session.execute(
         select(Appointment)
-        .join(Patient)
-        .where(Patient.user_id == user.id)
+        .options(
+            selectinload(Appointment.clinician).selectinload(Clinician.user),
+            selectinload(Appointment.hospital)
+        )
+        .where(Appointment.patient_id == patient.id)
         .where(Appointment.status == DBAppointmentStatus.UPCOMING)
         .order_by(Appointment.scheduled_date, Appointment.scheduled_time)
         .limit(5)
     )
     appointments = appointments_result.scalars().all()
     
-    # Get linked hospitals
+    # Get linked hospitals with their active departments
     hospital_links_result = await session.execute(
         select(PatientHospital, Hospital)
         .join(Hospital)
-        .join(Patient)
-        .where(Patient.user_id == user.id)
+        .where(PatientHospital.patient_id == patient.id)
+        .options(selectinload(Hospital.departments.and_(Department.is_active == True)))
         .order_by(PatientHospital.linked_at.desc())
     )
     hospital_links = hospital_links_result.all()
     
-    # Get stats
-    total_appointments = await session.scalar(
-        select(func.count(Appointment.id))
-        .join(Patient)
-        .where(Patient.user_id == user.id)
-    )
-    
-    completed_appointments = await session.scalar(
-        select(func.count(Appointment.id))
-        .join(Patient)
-        .where(Patient.user_id == user.id)
-        .where(Appointment.status == DBAppointmentStatus.COMPLETED)
-    )
-    
-    active_chats = await session.scalar(
-        select(func.count(TriageChat.id))
-        .where(TriageChat.patient_id == patient.id)
-        .where(TriageChat.is_active == True)
+    # Get stats in a single round trip
+    stats_result = await session.execute(
+        select(
+            select(func.count())
+            .select_from(Appointment)
+            .where(Appointment.patient_id == patient.id)
+            .scalar_subquery().label("total_appointments"),
+            select(func.count())
+            .select_from(Appointment)
+            .where(Appointment.patient_id == patient.id)
+            .where(Appointment.status == DBAppointmentStatus.COMPLETED)
+            .scalar_subquery().label("completed_appointments"),
+            select(func.count())
+            .select_from(TriageChat)
+            .where(TriageChat.patient_id == patient.id)
+            .where(TriageChat.is_active == True)
+            .scalar_subquery().label("active_chats"),
+        )
     )
+    total_appointments, completed_appointments, active_chats = stats_result.one()
     
     # Build response
     upcoming_appointments = []
     for apt in appointments:
-        # Get clinician and hospital info
-        clinician_result = await session.execute(
-            select(Clinician, User)
-            .join(User, Clinician.user_id == User.id)
-            .where(Clinician.id == apt.clinician_id)
-        )
-        clinician_data = clinician_result.first()
-        clinician = clinician_data[0] if clinician_data else None
-        clinician_user = clinician_data[1] if clinician_data else None
-        
-        hospital_result = await session.execute(
-            select(Hospital).where(Hospital.id == apt.hospital_id)
-        )
-        hospital = hospital_result.scalar_one_or_none()
+        clinician = apt.clinician
+        clinician_user = clinician.user if clinician else None
+        hospital = apt.hospital
         
         upcoming_appointments.append(AppointmentSummary(
             id=apt.id,
@@ -128,11 +121,7 @@ async def get_dashboard_data(
     
     linked_hospitals = []
     for link, hospital in hospital_links:
-        # Get departments
-        dept_result = await session.execute(
-            select(Department).where(Department.hospital_id == hospital.id).where(Department.is_active == True)
-        )
-        departments = [d.name for d in dept_result.scalars().all()]
+        departments = [d.name for d in hospital.departments]
         
         linked_hospitals.append(HospitalSummary(
             id=hospital.id,
@@ -143,7 +132,7 @@ async def get_dashboard_data(
             departments=departments[:4],  # Limit to 4 departments for display
             linked_since=link.linked_at,
             total_visits=link.total_visits or 0,
-            rating=float(hospital.rating) if hospital.rating else 0.0
+            rating=hospital.rating
         ))
     
     # Get recent recordings
@@ -219,6 +208,9 @@ async def get_dashboard_data(
     # Get recent chats
     chats_result = await session.execute(
         select(TriageChat)
+        .options(load_only(
+            TriageChat.id, TriageChat.title, TriageChat.updated_at, TriageChat.last_message_preview
+        ))
         .where(TriageChat.patient_id == patient.id)
         .order_by(desc(TriageChat.updated_at))
         .limit(5)
@@ -227,11 +219,8 @@ async def get_dashboard_data(
     
     recent_chats = []
     for chat in chats:
-        messages = chat.messages or []
-        preview = ""
-        if messages:
-            last_msg = messages[-1]
-            preview = last_msg.get("content", "")[:50] + ("..." if len(last_msg.get("content", "")) > 50 else "")
+        last_content = chat.last_message_preview or ""
+        preview = last_content[:50] + ("..." if len(last_content) > 50 else "")
         recent_chats.append(RecentChat(
             id=chat.id,
             title=chat.title,
@@ -277,7 +266,7 @@ async def search_hospitals(
                 Hospital.city.ilike(search_term)
             )
         )
-        .order_by(Hospital.rating.desc())
+        .order_by(Hospital.rating_tenths.desc())
         .limit(limit)
     )
     hospitals = result.scalars().all()
@@ -291,7 +280,7 @@ async def search_hospitals(
                 type=h.type.value if h.type else "General",
                 city=h.city,
                 state=h.state,
-                rating=float(h.rating) if h.rating else 0.0
+                rating=h.rating
             )
             for h in hospitals
         ],
@@ -322,7 +311,7 @@ async def get_all_hospitals(
                 type=h.type.value if h.type else "General",
                 city=h.city,
                 state=h.state,
-                rating=float(h.rating) if h.rating else 0.0
+                rating=h.rating
             )
             for h in hospitals
         ],
@@ -405,7 +394,7 @@ async def link_hospital(
             departments=departments[:4],
             linked_since=datetime.utcnow(),
             total_visits=0,
-            rating=float(hospital.rating) if hospital.rating else 0.0
+            rating=hospital.rating
         )
     )
 
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, update, func, or_, and_, desc
+from sqlalchemy import select, update, func, or_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
@@ -48,6 +48,25 @@ def _format_time_ago(dt: datetime) -> str:
         return f"{days}d ago"
 
 
+def _canonical_pair(user_a: UUID, user_b: UUID) -> tuple[UUID, UUID]:
+    """Order two participant IDs the way conversations store them (smaller ID first)."""
+    return (user_a, user_b) if str(user_a) < str(user_b) else (user_b, user_a)
+
+
+def _other_participant_id(conversation: Conversation, user_id: UUID) -> UUID:
+    """Return the ID of the participant who is not ``user_id``."""
+    if conversation.participant_1_id == user_id:
+        return conversation.participant_2_id
+    return conversation.participant_1_id
+
+
+def _unread_column(conversation: Conversation, user_id: UUID):
+    """Return the Conversation column counting messages unread by ``user_id``."""
+    if conversation.participant_1_id == user_id:
+        return Conversation.unread_count_p1
+    return Conversation.unread_count_p2
+
+
 def _get_user_display_info(user: User) -> tuple[str, str]:
     """Get display name and role for a user."""
     full_name = f"{user.first_name or ''} {user.last_name or ''}".strip() or "Unknown"
@@ -107,25 +126,17 @@ async def _build_conversation_response(
     
     other_name, other_role = _get_user_display_info(other_user)
     
-    # Get last message
+    # Get last message (preview columns only)
     last_msg_result = await session.execute(
-        select(Message)
+        select(Message.content_preview, Message.created_at)
         .where(Message.conversation_id == conversation.id)
         .order_by(desc(Message.created_at))
         .limit(1)
     )
-    last_message = last_msg_result.scalar_one_or_none()
+    last_message = last_msg_result.first()
     
-    # Count unread messages (messages from other user that current user hasn't read)
-    unread_result = await session.execute(
-        select(func.count(Message.id))
-        .where(
-            Message.conversation_id == conversation.id,
-            Message.sender_id != current_user_id,
-            Message.is_read == False
-        )
-    )
-    unread_count = unread_result.scalar() or 0
+    # Unread messages from the other user are counted on the conversation row
+    unread_count = getattr(conversation, _unread_column(conversation, current_user_id).key)
     
     # Check if other user is online (for clinicians)
     is_online = False
@@ -138,7 +149,7 @@ async def _build_conversation_response(
         clinician_name=other_name,
         clinician_role=other_role,
         clinician_avatar=_get_initials(other_name),
-        last_message=last_message.content[:80] + "..." if last_message and len(last_message.content) > 80 else (last_message.content if last_message else None),
+        last_message=last_message.content_preview if last_message else None,
         last_message_time=_format_time_ago(last_message.created_at) if last_message else None,
         unread_count=unread_count,
         is_online=is_online,
@@ -289,7 +300,10 @@ async def send_message(
     
     session.add(new_message)
     
-    # Update conversation timestamps
+    # Update conversation timestamps and the recipient's unread counter (in SQL, so
+    # concurrent sends can't lose increments)
+    recipient_unread = _unread_column(conversation, _other_participant_id(conversation, user.id))
+    setattr(conversation, recipient_unread.key, recipient_unread + 1)
     conversation.updated_at = datetime.utcnow()
     conversation.last_message_at = datetime.utcnow()
     
@@ -325,25 +339,17 @@ async def start_conversation(
     if not other_user:
         return StartConversationResponse(success=False, message="User not found")
     
-    # Check if conversation already exists (in either direction)
+    # Participants are stored in canonical order, so this is a single probe
+    # of the (participant_1_id, participant_2_id) unique index
+    p1_id, p2_id = _canonical_pair(user.id, other_user_id)
     existing_result = await session.execute(
         select(Conversation)
         .options(
             selectinload(Conversation.participant_1).selectinload(User.clinician),
             selectinload(Conversation.participant_2).selectinload(User.clinician)
         )
-        .where(
-            or_(
-                and_(
-                    Conversation.participant_1_id == user.id,
-                    Conversation.participant_2_id == other_user_id
-                ),
-                and_(
-                    Conversation.participant_1_id == other_user_id,
-                    Conversation.participant_2_id == user.id
-                )
-            )
-        )
+        .where(Conversation.participant_1_id == p1_id)
+        .where(Conversation.participant_2_id == p2_id)
     )
     existing = existing_result.scalar_one_or_none()
     
@@ -355,9 +361,7 @@ async def start_conversation(
             conversation=conv_response
         )
     
-    # Create new conversation (smaller ID first for consistency)
-    p1_id, p2_id = (user.id, other_user_id) if str(user.id) < str(other_user_id) else (other_user_id, user.id)
-    
+    # Create new conversation
     new_conversation = Conversation(
         participant_1_id=p1_id,
         participant_2_id=p2_id
@@ -376,6 +380,7 @@ async def start_conversation(
         )
         session.add(initial_msg)
         new_conversation.last_message_at = datetime.utcnow()
+        setattr(new_conversation, _unread_column(new_conversation, other_user_id).key, 1)
     
     await session.commit()
     
@@ -432,6 +437,9 @@ async def mark_messages_read(
         )
         .values(is_read=True)
     )
+    # Take off only the rows marked here; a message sent meanwhile keeps its count
+    reader_unread = _unread_column(conversation, user.id)
+    setattr(conversation, reader_unread.key, func.greatest(reader_unread - result.rowcount, 0))
     
     await session.commit()
     
@@ -575,6 +583,15 @@ async def delete_message(
     if not message:
         return DeleteMessageResponse(success=False, message="Message not found or not authorized")
     
+    # An unread message no longer waits for the recipient
+    if not message.is_read:
+        conv_result = await session.execute(
+            select(Conversation).where(Conversation.id == message.conversation_id)
+        )
+        conversation = conv_result.scalar_one()
+        recipient_unread = _unread_column(conversation, _other_participant_id(conversation, user.id))
+        setattr(conversation, recipient_unread.key, func.greatest(recipient_unread - 1, 0))
+    
     # Delete message
     await session.delete(message)
     await session.commit()
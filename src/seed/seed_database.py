@@ -352,6 +352,8 @@ async def create_appointments(
     """Create sample appointments"""
     appointments = []
     doctors = [c for c in clinicians if c.role_type == ClinicianRoleType.DOCTOR]
+    # (doctor, date) -> booked (start, end) minutes; the DB rejects overlapping slots
+    booked = {}
     
     for patient in patients:
         # Each patient has 1-5 appointments
@@ -365,6 +367,13 @@ async def create_appointments(
             days_offset = random.randint(-30, 30)
             scheduled_date = date.today() + timedelta(days=days_offset)
             
+            start = random.randint(8, 17) * 60 + random.choice([0, 30])
+            duration = random.choice([15, 30, 45, 60])
+            slots = booked.setdefault((doctor.id, scheduled_date), [])
+            if any(start < slot_end and slot_start < start + duration for slot_start, slot_end in slots):
+                continue
+            slots.append((start, start + duration))
+            
             # Determine status based on date
             if days_offset < -7:
                 status = random.choice([AppointmentStatus.COMPLETED, AppointmentStatus.NO_SHOW])
@@ -381,8 +390,8 @@ async def create_appointments(
                 hospital_id=hospital.id,
                 department_id=dept.id if dept else None,
                 scheduled_date=scheduled_date,
-                scheduled_time=time(random.randint(8, 17), random.choice([0, 30])),
-                duration_minutes=random.choice([15, 30, 45, 60]),
+                scheduled_time=time(start // 60, start % 60),
+                duration_minutes=duration,
                 type=random.choice(list(AppointmentType)),
                 status=status,
                 notes="Routine consultation" if random.random() > 0.5 else None
@@ -759,6 +768,12 @@ async def create_conversations_and_messages(
             )
             session.add(message)
             messages.append(message)
+        
+        # The last message is unread by whoever didn't send it
+        if sender_id == p1_id:
+            conversation.unread_count_p2 = 1
+        else:
+            conversation.unread_count_p1 = 1
     
     await session.flush()
     print(f"✓ Created {len(conversations)} conversations with {len(messages)} messages")